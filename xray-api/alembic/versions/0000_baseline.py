@@ -0,0 +1,100 @@
+"""baseline schema
+
+The runs and steps tables exactly as the API created them with
+Base.metadata.create_all() before it switched to Alembic. Steps are a
+plain table here, with candidate samples stored inline in
+steps.candidates_data.
+
+Databases created by that older API already have these tables. Mark them
+as being at this revision instead of re-creating them, then upgrade:
+
+    alembic stamp 0000
+    alembic upgrade head
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-01-05 00:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0000"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+RUN_STATUS = sa.Enum("RUNNING", "SUCCESS", "FAILURE", "PARTIAL", name="runstatus")
+STEP_TYPE = sa.Enum("LLM", "SEARCH", "FILTER", "RANK", "SELECT", "TRANSFORM", "CUSTOM", name="steptype")
+
+
+def upgrade() -> None:
+    # -------------------------------------------------------------------------
+    # runs
+    # -------------------------------------------------------------------------
+    op.create_table(
+        "runs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("pipeline_name", sa.String(), nullable=False),
+        sa.Column("pipeline_version", sa.String(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=False),
+        sa.Column("end_time", sa.DateTime(), nullable=True),
+        sa.Column("status", RUN_STATUS, nullable=False),
+        sa.Column("metadata", postgresql.JSONB(), nullable=True),
+        sa.Column("final_output", postgresql.JSONB(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_runs_id", "runs", ["id"])
+    op.create_index("ix_runs_pipeline_name", "runs", ["pipeline_name"])
+    op.create_index("ix_runs_start_time", "runs", ["start_time"])
+    op.create_index("ix_runs_status", "runs", ["status"])
+    op.create_index("idx_run_pipeline_status", "runs", ["pipeline_name", "status"])
+    op.create_index("idx_run_start_time", "runs", ["start_time"])
+
+    # -------------------------------------------------------------------------
+    # steps (plain table, inline candidates_data)
+    # -------------------------------------------------------------------------
+    op.create_table(
+        "steps",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("run_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("step_name", sa.String(), nullable=False),
+        sa.Column("step_type", STEP_TYPE, nullable=False),
+        sa.Column("sequence", sa.Integer(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=True),
+        sa.Column("end_time", sa.DateTime(), nullable=True),
+        sa.Column("inputs", postgresql.JSONB(), nullable=True),
+        sa.Column("outputs", postgresql.JSONB(), nullable=True),
+        sa.Column("reasoning", sa.String(), nullable=True),
+        sa.Column("candidates_in", sa.Integer(), nullable=True),
+        sa.Column("candidates_out", sa.Integer(), nullable=True),
+        sa.Column("candidates_data", postgresql.JSONB(), nullable=True),
+        sa.Column("filters_applied", postgresql.JSONB(), nullable=True),
+        sa.Column("metadata", postgresql.JSONB(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_steps_id", "steps", ["id"])
+    op.create_index("ix_steps_run_id", "steps", ["run_id"])
+    op.create_index("ix_steps_step_name", "steps", ["step_name"])
+    op.create_index("ix_steps_step_type", "steps", ["step_type"])
+    op.create_index("ix_steps_candidates_in", "steps", ["candidates_in"])
+    op.create_index("ix_steps_candidates_out", "steps", ["candidates_out"])
+    op.create_index("idx_step_run_sequence", "steps", ["run_id", "sequence"])
+    op.create_index("idx_step_type", "steps", ["step_type"])
+    op.create_index("idx_step_name", "steps", ["step_name"])
+    op.create_index("idx_step_candidates", "steps", ["candidates_in", "candidates_out"])
+
+
+def downgrade() -> None:
+    op.drop_table("steps")
+    op.drop_table("runs")
+    STEP_TYPE.drop(op.get_bind(), checkfirst=True)
+    RUN_STATUS.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,195 @@
+"""partition steps by month
+
+Converts the baseline steps table (0000) into the RANGE-partitioned one in
+app/models.py:
+- start_time becomes part of the primary key (it is the partition key).
+  Steps without one take their run's start_time, as ingest does. Step ids
+  are no longer unique on their own - only (id, start_time) is.
+- candidates_data_uri is added for samples in the candidate store. Existing
+  samples stay inline in candidates_data, which the query router falls back to.
+- reduction_rate is a stored generated column.
+- GIN (jsonb_path_ops) indexes cover the JSONB columns.
+
+Existing steps are copied into monthly partitions (steps_YYYY_MM), one for
+each month they cover. Later partitions are created at runtime by
+app.database.ensure_step_partitions. steps_default catches the rest.
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-01-12 00:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = "0000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Existing type, created by 0000
+STEP_TYPE = postgresql.ENUM(
+    "LLM", "SEARCH", "FILTER", "RANK", "SELECT", "TRANSFORM", "CUSTOM",
+    name="steptype", create_type=False,
+)
+
+# Columns that exist in both layouts (copied as-is)
+SHARED_COLUMNS = (
+    "id, run_id, step_name, step_type, sequence, start_time, end_time, inputs, outputs, "
+    "reasoning, candidates_in, candidates_out, candidates_data, filters_applied, metadata, created_at"
+)
+
+BASELINE_INDEXES = (
+    ("ix_steps_id", ["id"]),
+    ("ix_steps_run_id", ["run_id"]),
+    ("ix_steps_step_name", ["step_name"]),
+    ("ix_steps_step_type", ["step_type"]),
+    ("ix_steps_candidates_in", ["candidates_in"]),
+    ("ix_steps_candidates_out", ["candidates_out"]),
+    ("idx_step_run_sequence", ["run_id", "sequence"]),
+    ("idx_step_type", ["step_type"]),
+    ("idx_step_name", ["step_name"]),
+    ("idx_step_candidates", ["candidates_in", "candidates_out"]),
+)
+
+PARTITIONED_INDEXES = BASELINE_INDEXES + (
+    ("ix_steps_reduction_rate", ["reduction_rate"]),
+)
+
+GIN_INDEXES = (
+    ("idx_step_filters_gin", "filters_applied"),
+    ("idx_step_inputs_gin", "inputs"),
+    ("idx_step_outputs_gin", "outputs"),
+    ("idx_step_metadata_gin", "metadata"),
+)
+
+# One steps_YYYY_MM partition per month the existing steps cover. They must
+# exist before the copy: a monthly partition can't be attached later while
+# steps_default holds rows in its range.
+CREATE_MONTHLY_PARTITIONS = """
+DO $$
+DECLARE
+    month date;
+BEGIN
+    FOR month IN
+        SELECT DISTINCT date_trunc('month', COALESCE(s.start_time, r.start_time))::date
+        FROM steps_baseline s JOIN runs r ON r.id = s.run_id
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF steps FOR VALUES FROM (%L) TO (%L)',
+            'steps_' || to_char(month, 'YYYY_MM'), month, (month + interval '1 month')::date
+        );
+    END LOOP;
+END $$
+"""
+
+
+def upgrade() -> None:
+    op.alter_column("runs", "id", server_default=sa.text("gen_random_uuid()"))
+
+    # -------------------------------------------------------------------------
+    # Move the baseline table aside (its index names are reused below)
+    # -------------------------------------------------------------------------
+    op.rename_table("steps", "steps_baseline")
+    op.execute("ALTER INDEX steps_pkey RENAME TO steps_baseline_pkey")
+    for index_name, _ in BASELINE_INDEXES:
+        op.drop_index(index_name, table_name="steps_baseline")
+
+    # -------------------------------------------------------------------------
+    # steps (RANGE-partitioned by start_time)
+    # -------------------------------------------------------------------------
+    op.create_table(
+        "steps",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("run_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("step_name", sa.String(), nullable=False),
+        sa.Column("step_type", STEP_TYPE, nullable=False),
+        sa.Column("sequence", sa.Integer(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=False),
+        sa.Column("end_time", sa.DateTime(), nullable=True),
+        sa.Column("inputs", postgresql.JSONB(), nullable=True),
+        sa.Column("outputs", postgresql.JSONB(), nullable=True),
+        sa.Column("reasoning", sa.String(), nullable=True),
+        sa.Column("candidates_in", sa.Integer(), nullable=True),
+        sa.Column("candidates_out", sa.Integer(), nullable=True),
+        sa.Column("candidates_data_uri", sa.String(), nullable=True),
+        sa.Column("candidates_data", postgresql.JSONB(), nullable=True),
+        sa.Column(
+            "reduction_rate",
+            sa.Float(),
+            sa.Computed("(candidates_in - candidates_out)::float / NULLIF(candidates_in, 0)", persisted=True),
+            nullable=True,
+        ),
+        sa.Column("filters_applied", postgresql.JSONB(), nullable=True),
+        sa.Column("metadata", postgresql.JSONB(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id", "start_time"),
+        postgresql_partition_by="RANGE (start_time)",
+    )
+    op.execute("CREATE TABLE IF NOT EXISTS steps_default PARTITION OF steps DEFAULT")
+    op.execute(CREATE_MONTHLY_PARTITIONS)
+
+    # -------------------------------------------------------------------------
+    # Copy existing steps, then drop the baseline table
+    # -------------------------------------------------------------------------
+    op.execute(
+        f"INSERT INTO steps ({SHARED_COLUMNS}) "
+        f"SELECT s.id, s.run_id, s.step_name, s.step_type, s.sequence, "
+        f"COALESCE(s.start_time, r.start_time), s.end_time, s.inputs, s.outputs, s.reasoning, "
+        f"s.candidates_in, s.candidates_out, s.candidates_data, s.filters_applied, s.metadata, s.created_at "
+        f"FROM steps_baseline s JOIN runs r ON r.id = s.run_id"
+    )
+    op.drop_table("steps_baseline")
+
+    # Indexes after the copy - one build per index instead of per-row upkeep
+    for index_name, columns in PARTITIONED_INDEXES:
+        op.create_index(index_name, "steps", columns)
+
+    for index_name, column in GIN_INDEXES:
+        op.create_index(
+            index_name, "steps", [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    # Steps whose samples live in the candidate store come back without them
+    # (candidates_data is NULL for those rows); the blobs are left in place.
+    op.rename_table("steps", "steps_partitioned")
+    op.execute("ALTER INDEX steps_pkey RENAME TO steps_partitioned_pkey")
+
+    op.create_table(
+        "steps",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("run_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("step_name", sa.String(), nullable=False),
+        sa.Column("step_type", STEP_TYPE, nullable=False),
+        sa.Column("sequence", sa.Integer(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=True),
+        sa.Column("end_time", sa.DateTime(), nullable=True),
+        sa.Column("inputs", postgresql.JSONB(), nullable=True),
+        sa.Column("outputs", postgresql.JSONB(), nullable=True),
+        sa.Column("reasoning", sa.String(), nullable=True),
+        sa.Column("candidates_in", sa.Integer(), nullable=True),
+        sa.Column("candidates_out", sa.Integer(), nullable=True),
+        sa.Column("candidates_data", postgresql.JSONB(), nullable=True),
+        sa.Column("filters_applied", postgresql.JSONB(), nullable=True),
+        sa.Column("metadata", postgresql.JSONB(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(f"INSERT INTO steps ({SHARED_COLUMNS}) SELECT {SHARED_COLUMNS} FROM steps_partitioned")
+    op.drop_table("steps_partitioned")  # Drops all partitions and their indexes with it
+
+    for index_name, columns in BASELINE_INDEXES:
+        op.create_index(index_name, "steps", columns)
+
+    op.alter_column("runs", "id", server_default=None)
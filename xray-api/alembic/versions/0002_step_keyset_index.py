@@ -0,0 +1,28 @@
+"""step keyset pagination index
+
+Backs keyset pagination in POST /api/steps/query
+(ORDER BY start_time DESC, id DESC).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-01-13 00:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_step_starttime_id", "steps", [sa.text("start_time DESC"), sa.text("id DESC")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_step_starttime_id", table_name="steps")
@@ -0,0 +1,31 @@
+"""step filter composite indexes
+
+(step_type | step_name, start_time DESC, id DESC) so the common
+POST /api/steps/query shapes - filter by type or name, newest first -
+are served by a single index range scan.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-01-13 00:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_step_type_start", "steps", ["step_type", sa.text("start_time DESC"), sa.text("id DESC")])
+    op.create_index("ix_step_name_start", "steps", ["step_name", sa.text("start_time DESC"), sa.text("id DESC")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_step_name_start", table_name="steps")
+    op.drop_index("ix_step_type_start", table_name="steps")
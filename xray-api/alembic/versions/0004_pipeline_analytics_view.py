@@ -0,0 +1,65 @@
+"""pipeline analytics materialized view
+
+Precomputes GET /api/analytics/pipeline/{pipeline_name} for every pipeline.
+The unique index on pipeline_name allows REFRESH ... CONCURRENTLY, so
+refreshes don't block readers.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-01-14 00:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_pipeline_analytics AS
+        WITH run_stats AS (
+            SELECT
+                pipeline_name,
+                count(*) AS total_runs,
+                count(*) FILTER (WHERE status = 'SUCCESS') AS success_count,
+                count(*) FILTER (WHERE status = 'FAILURE') AS failure_count,
+                avg(extract(epoch FROM end_time - start_time) * 1000) AS avg_duration_ms
+            FROM runs
+            GROUP BY pipeline_name
+        ),
+        step_type_counts AS (
+            SELECT r.pipeline_name, lower(s.step_type::text) AS step_type, count(*) AS n
+            FROM steps s
+            JOIN runs r ON r.id = s.run_id
+            GROUP BY r.pipeline_name, s.step_type
+        ),
+        step_stats AS (
+            SELECT
+                pipeline_name,
+                sum(n)::bigint AS total_steps,
+                jsonb_object_agg(step_type, n) AS steps_by_type
+            FROM step_type_counts
+            GROUP BY pipeline_name
+        )
+        SELECT
+            rs.pipeline_name,
+            rs.total_runs,
+            rs.success_count,
+            rs.failure_count,
+            rs.avg_duration_ms::float AS avg_duration_ms,
+            coalesce(ss.total_steps, 0) AS total_steps,
+            coalesce(ss.steps_by_type, '{}'::jsonb) AS steps_by_type
+        FROM run_stats rs
+        LEFT JOIN step_stats ss USING (pipeline_name)
+    """)
+    op.execute("CREATE UNIQUE INDEX ux_mv_pipeline_analytics_name ON mv_pipeline_analytics (pipeline_name)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_pipeline_analytics")
@@ -0,0 +1,106 @@
+"""pipeline step type rollup
+
+Adds pipeline_step_type_counts, a per-(pipeline, step type) step counter
+incremented at ingest, and backfills it from existing steps.
+mv_pipeline_analytics is rebuilt to read steps_by_type from it, so
+refreshes no longer scan the steps table.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-01-15 00:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Existing type, created by 0000
+STEP_TYPE = postgresql.ENUM(
+    "LLM", "SEARCH", "FILTER", "RANK", "SELECT", "TRANSFORM", "CUSTOM",
+    name="steptype", create_type=False,
+)
+
+RUN_STATS_SQL = """
+    SELECT
+        pipeline_name,
+        count(*) AS total_runs,
+        count(*) FILTER (WHERE status = 'SUCCESS') AS success_count,
+        count(*) FILTER (WHERE status = 'FAILURE') AS failure_count,
+        avg(extract(epoch FROM end_time - start_time) * 1000) AS avg_duration_ms
+    FROM runs
+    GROUP BY pipeline_name
+"""
+
+VIEW_SELECT_SQL = """
+    SELECT
+        rs.pipeline_name,
+        rs.total_runs,
+        rs.success_count,
+        rs.failure_count,
+        rs.avg_duration_ms::float AS avg_duration_ms,
+        coalesce(ss.total_steps, 0) AS total_steps,
+        coalesce(ss.steps_by_type, '{}'::jsonb) AS steps_by_type
+    FROM run_stats rs
+    LEFT JOIN step_stats ss USING (pipeline_name)
+"""
+
+
+def _create_view(step_type_counts_sql: str) -> None:
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW mv_pipeline_analytics AS
+        WITH run_stats AS ({RUN_STATS_SQL}),
+        step_type_counts AS ({step_type_counts_sql}),
+        step_stats AS (
+            SELECT
+                pipeline_name,
+                sum(n)::bigint AS total_steps,
+                jsonb_object_agg(step_type, n) AS steps_by_type
+            FROM step_type_counts
+            GROUP BY pipeline_name
+        )
+        {VIEW_SELECT_SQL}
+    """)
+    op.execute("CREATE UNIQUE INDEX ux_mv_pipeline_analytics_name ON mv_pipeline_analytics (pipeline_name)")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pipeline_step_type_counts",
+        sa.Column("pipeline_name", sa.String(), nullable=False),
+        sa.Column("step_type", STEP_TYPE, nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("pipeline_name", "step_type"),
+    )
+    op.execute("""
+        INSERT INTO pipeline_step_type_counts (pipeline_name, step_type, count)
+        SELECT r.pipeline_name, s.step_type, count(*)
+        FROM steps s
+        JOIN runs r ON r.id = s.run_id
+        GROUP BY r.pipeline_name, s.step_type
+    """)
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_pipeline_analytics")
+    _create_view("""
+        SELECT pipeline_name, lower(step_type::text) AS step_type, count AS n
+        FROM pipeline_step_type_counts
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_pipeline_analytics")
+    _create_view("""
+        SELECT r.pipeline_name, lower(s.step_type::text) AS step_type, count(*) AS n
+        FROM steps s
+        JOIN runs r ON r.id = s.run_id
+        GROUP BY r.pipeline_name, s.step_type
+    """)
+    op.drop_table("pipeline_step_type_counts")
@@ -0,0 +1,31 @@
+"""run metadata GIN index
+
+GIN (jsonb_path_ops) index on runs.metadata for the ?metadata= containment
+filter on GET /api/runs.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-01-15 00:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_run_metadata_gin", "runs", ["metadata"],
+        postgresql_using="gin",
+        postgresql_ops={"metadata": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_run_metadata_gin", table_name="runs")
@@ -8,8 +8,9 @@ Reference: IMPLEMENTATION_PLAN.md -> "API Backend Architecture"
 """
 
 import os
+from functools import lru_cache
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, field_validator
 
 
 class Settings(BaseSettings):
@@ -18,18 +19,63 @@ class Settings(BaseSettings):
 
     All settings can be overridden via environment variables:
     - DATABASE_URL: PostgreSQL connection string
+    - DB_POOL_SIZE: Persistent connections kept in the pool
+    - DB_MAX_OVERFLOW: Extra connections allowed under burst load
+    - DB_QUERY_CACHE_SIZE: Compiled SQL statements cached per engine
+    - XRAY_AUTO_MIGRATE: Set to 1 to apply migrations on startup
+    - COPY_INGEST_THRESHOLD: Step count above which ingest uses COPY
+    - STEP_PARTITIONS_AHEAD: Future monthly steps partitions to keep created
     - API_HOST: Host to bind to
     - API_PORT: Port to listen on
     - LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR)
+    - GZIP_MINIMUM_SIZE: Smallest response (bytes) worth compressing
+    - GZIP_COMPRESSLEVEL: gzip compression level (1-9)
+    - ANALYTICS_REFRESH_SECONDS: Pipeline analytics refresh interval
+    - ANALYTICS_CACHE_TTL_SECONDS: Pipeline analytics response cache TTL
+    - CURSOR_SECRET: Key used to sign pagination cursors (required with several workers)
+    - CURSOR_TTL_SECONDS: How long a pagination cursor stays valid
+    - WEB_CONCURRENCY: Worker processes (read by uvicorn/gunicorn too)
+    - CANDIDATES_STORE_URI: Blob storage for candidate data (file:// or s3://)
+    - CANDIDATES_S3_ENDPOINT_URL: Custom S3 endpoint (MinIO)
     """
 
     # Database
     database_url: str = Field(
         default=os.getenv(
             "DATABASE_URL",
-            "postgresql://animeshdhillon@localhost:5432/xray_db"
+            "postgresql+psycopg://animeshdhillon@localhost:5432/xray_db"
         ),
-        description="PostgreSQL connection string"
+        description="PostgreSQL connection string (psycopg 3 driver)"
+    )
+
+    db_pool_size: int = Field(
+        default=int(os.getenv("DB_POOL_SIZE", "20")),
+        description="Persistent connections kept in the pool"
+    )
+
+    db_max_overflow: int = Field(
+        default=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        description="Extra connections allowed under burst load"
+    )
+
+    auto_migrate: bool = Field(
+        default=os.getenv("XRAY_AUTO_MIGRATE", "0") == "1",
+        description="Run Alembic migrations on startup (otherwise run `alembic upgrade head` on deploy)"
+    )
+
+    db_query_cache_size: int = Field(
+        default=int(os.getenv("DB_QUERY_CACHE_SIZE", "1200")),
+        description="Compiled statements SQLAlchemy keeps per engine (one per query/filter shape)"
+    )
+
+    copy_ingest_threshold: int = Field(
+        default=int(os.getenv("COPY_INGEST_THRESHOLD", "100")),
+        description="Ingest batches with more steps than this use COPY instead of INSERT"
+    )
+
+    step_partitions_ahead: int = Field(
+        default=int(os.getenv("STEP_PARTITIONS_AHEAD", "2")),
+        description="Monthly steps partitions to pre-create beyond the current month"
     )
 
     # API Server
@@ -64,10 +110,91 @@ class Settings(BaseSettings):
     default_page_size: int = 50
     max_page_size: int = 1000
 
+    # Response compression
+    gzip_minimum_size: int = Field(
+        default=int(os.getenv("GZIP_MINIMUM_SIZE", "1024")),
+        description="Responses smaller than this (bytes) are sent uncompressed"
+    )
+
+    gzip_compresslevel: int = Field(
+        default=int(os.getenv("GZIP_COMPRESSLEVEL", "5")),
+        description="gzip level (1-9) - 5 trades a little ratio for much less CPU than 9"
+    )
+
+    # Candidate storage (out-of-line blobs for steps.candidates_data)
+    candidates_store_uri: str = Field(
+        default=os.getenv("CANDIDATES_STORE_URI", "file:./.xray/candidates"),
+        description="Where sampled candidate data is stored (file:./relative, file:///absolute or s3://bucket/prefix)"
+    )
+
+    candidates_s3_endpoint_url: str | None = Field(
+        default=os.getenv("CANDIDATES_S3_ENDPOINT_URL"),
+        description="Custom S3 endpoint (e.g., MinIO); None for AWS"
+    )
+
+    # Analytics
+    analytics_refresh_seconds: int = Field(
+        default=int(os.getenv("ANALYTICS_REFRESH_SECONDS", "60")),
+        description="How often the pipeline analytics materialized view is refreshed"
+    )
+
+    analytics_cache_ttl_seconds: int = Field(
+        default=int(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "60")),
+        description="How long a pipeline's analytics response is cached in-process"
+    )
+
+    analytics_cache_size: int = 256  # Pipelines kept in the analytics cache
+
+    # Pagination cursors
+    cursor_secret: str = Field(
+        default=os.getenv("CURSOR_SECRET", ""),
+        description="HMAC key for step query cursors (required when running several workers)"
+    )
+
+    cursor_ttl_seconds: int = Field(
+        default=int(os.getenv("CURSOR_TTL_SECONDS", "86400")),
+        description="Seconds a step query cursor stays valid after it was issued",
+        gt=0,
+    )
+
+    web_concurrency: int = Field(
+        default=int(os.getenv("WEB_CONCURRENCY", "1")),
+        description="Worker processes serving the API - more than one requires CURSOR_SECRET"
+    )
+
+    # Caching
+    run_cache_size: int = Field(
+        default=int(os.getenv("RUN_CACHE_SIZE", "1024")),
+        description="Finished runs kept in the run-detail response cache"
+    )
+
+    @field_validator("database_url")
+    @classmethod
+    def use_psycopg3_driver(cls, v: str) -> str:
+        """Route plain postgresql:// URLs to the psycopg 3 driver"""
+        for prefix in ("postgresql://", "postgres://"):
+            if v.startswith(prefix):
+                return "postgresql+psycopg://" + v[len(prefix):]
+        return v
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the settings instance (parsed from the environment once).
+
+    Usable as a FastAPI dependency; tests can call get_settings.cache_clear()
+    after changing environment variables.
+
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
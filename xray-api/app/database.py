@@ -6,49 +6,290 @@ Configures SQLAlchemy engine, session, and base model.
 Reference: IMPLEMENTATION_PLAN.md -> "Database Schema"
 """
 
-from sqlalchemy import create_engine
+from contextlib import asynccontextmanager
+from pathlib import Path
+from datetime import date, datetime
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.sql.visitors import InternalTraversal
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional
+import asyncio
+import enum
+import logging
+
+import orjson
+from psycopg.types.json import Jsonb
 
 from .config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
+logger = logging.getLogger(__name__)
+
+# xray-api/alembic.ini
+ALEMBIC_INI_PATH = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+# Create async SQLAlchemy engine (psycopg 3 async driver - same URL as sync)
+engine = create_async_engine(
     settings.database_url,
     pool_pre_ping=True,  # Verify connections before using
+    pool_size=settings.db_pool_size,  # Avoid connection thrashing under concurrent ingest
+    max_overflow=settings.db_max_overflow,
+    # Statements are compiled once per shape and reused (bind values vary);
+    # /steps/query alone has a few hundred filter combinations
+    query_cache_size=settings.db_query_cache_size,
     echo=False,  # Set to True for SQL query logging
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects stay readable after commit without an implicit (sync) refresh
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency for FastAPI to get database session.
+    Dependency for FastAPI to get an async database session.
+
+    Database I/O is awaited, so a handler waiting on Postgres yields the
+    event loop to other requests instead of blocking the worker.
 
     Usage:
         @app.get("/runs")
-        def get_runs(db: Session = Depends(get_db)):
-            return db.query(Run).all()
+        async def get_runs(db: AsyncSession = Depends(get_db)):
+            return (await db.scalars(select(Run))).all()
 
     Automatically closes session after request.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
+@asynccontextmanager
+async def pipeline(db: AsyncSession) -> AsyncIterator[None]:
+    """
+    Run the enclosed statements in psycopg 3 pipeline mode.
+
+    Statements are sent without waiting for each result, so a burst of
+    INSERTs costs roughly one network roundtrip instead of one per statement.
+    Falls back to normal execution for drivers without pipeline support.
+
+    Usage:
+        async with pipeline(db):
+            await db.execute(insert(Run), run_rows)
+            await db.execute(insert(Step), step_rows)
+    """
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    enter_pipeline = getattr(raw_connection.driver_connection, "pipeline", None)
+
+    if enter_pipeline is None:
+        yield
+        return
+
+    async with enter_pipeline():
+        yield
+
+
+async def copy_rows(db: AsyncSession, model, rows: List[Dict[str, Any]]) -> None:
+    """
+    Bulk-load rows into a model's table with COPY FROM STDIN (psycopg 3).
+
+    COPY skips per-statement parsing and planning, so it is several times
+    faster than multi-row INSERT for large, wide batches. Rows use ORM
+    attribute keys (as for insert(model)); Python-side column defaults
+    (e.g., created_at) are applied here since COPY bypasses SQLAlchemy.
+    Computed columns are left to Postgres. Runs in the session's transaction.
+
+    Note: COPY cannot run inside pipeline mode.
+
+    Usage:
+        await copy_rows(db, Step, step_rows)
+    """
+    table = model.__table__
+    fields = [
+        (prop.key, prop.columns[0])
+        for prop in inspect(model).column_attrs
+        if prop.columns[0].computed is None
+    ]
+    column_names = ", ".join(f'"{column.name}"' for _, column in fields)
+
+    def to_copy_value(row, key, column):
+        if key in row:
+            value = row[key]
+        elif column.default is not None:
+            # Mirror insert(): Python-side defaults apply only to missing keys
+            value = column.default.arg({}) if column.default.is_callable else column.default.arg
+        else:
+            value = None
+
+        if value is None:
+            return None
+        if isinstance(column.type, JSONB):
+            return Jsonb(value, dumps=_dumps_json)
+        if isinstance(value, enum.Enum):
+            return value.name  # SQLAlchemy stores enum member names
+        return value
+
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+
+    async with raw_connection.driver_connection.cursor() as cursor:
+        async with cursor.copy(f"COPY {table.name} ({column_names}) FROM STDIN") as copy:
+            for row in rows:
+                await copy.write_row([to_copy_value(row, key, column) for key, column in fields])
+
+
+class ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement> - bind parameters are passed as usual"""
+
+    # Cache key = the wrapped statement's, so compiled SQL is cached per filter shape
+    inherit_cache = True
+    _traverse_internals = [("statement", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(ExplainJSON, "postgresql")
+def _compile_explain_json(element: ExplainJSON, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_row_count(db: AsyncSession, statement) -> int:
+    """
+    Estimate how many rows a SELECT returns from the planner, without running it.
+
+    Reads "Plan Rows" from EXPLAIN, so it costs one planning pass instead of
+    a COUNT(*) scan. Accuracy depends on table statistics (ANALYZE).
+
+    Usage:
+        await estimate_row_count(db, select(Step.id).where(Step.step_type == StepType.LLM))
+    """
+    result = await db.execute(ExplainJSON(statement))
+    plan = result.scalar_one()
+    if isinstance(plan, (str, bytes)):
+        plan = orjson.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _dumps_json(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+def _add_months(month: date, months: int) -> date:
+    """Return the first day of the month `months` after `month`"""
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+# Insertable steps columns (reduction_rate is generated), for moving rows
+_STEP_COLUMNS_SQL = """
+SELECT string_agg(quote_ident(column_name), ', ' ORDER BY ordinal_position)
+FROM information_schema.columns
+WHERE table_schema = current_schema() AND table_name = 'steps' AND is_generated = 'NEVER'
+"""
+
+
+async def ensure_step_partitions(months_ahead: Optional[int] = None, today: Optional[date] = None):
+    """
+    Create monthly partitions of the steps table.
+
+    Creates steps_YYYY_MM for the current month and the next `months_ahead`
+    months, plus a steps_default partition that catches anything outside
+    them (e.g., backfilled traces). Idempotent - safe to run repeatedly.
+
+    Postgres refuses to create a partition while steps_default holds rows
+    in its range (e.g., steps ingested while the task was down). Those rows
+    are moved into the new partition: steps_default is detached, the
+    partition created, the rows moved and steps_default re-attached, all in
+    one transaction (it holds an exclusive lock on steps while it runs).
+
+    Args:
+        months_ahead: Future months to create (default: settings.step_partitions_ahead)
+        today: Reference date (default: today, UTC)
+
+    Example:
+        await ensure_step_partitions()  # in Jan 2026 creates steps_2026_01..steps_2026_03
+    """
+    if months_ahead is None:
+        months_ahead = settings.step_partitions_ahead
+    current_month = (today or datetime.utcnow().date()).replace(day=1)
+
+    async with engine.begin() as connection:
+        has_default = await connection.scalar(text("SELECT to_regclass('steps_default') IS NOT NULL"))
+
+        for offset in range(months_ahead + 1):
+            start = _add_months(current_month, offset)
+            end = _add_months(start, 1)
+            partition = f"steps_{start:%Y_%m}"
+            if await connection.scalar(text(f"SELECT to_regclass('{partition}') IS NOT NULL")):
+                continue
+
+            in_range = f"start_time >= '{start.isoformat()}' AND start_time < '{end.isoformat()}'"
+            create_partition = text(
+                f"CREATE TABLE {partition} PARTITION OF steps "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+            stranded = has_default and await connection.scalar(
+                text(f"SELECT EXISTS (SELECT 1 FROM steps_default WHERE {in_range})")
+            )
+            if not stranded:
+                await connection.execute(create_partition)
+                continue
+
+            columns = await connection.scalar(text(_STEP_COLUMNS_SQL))
+            await connection.execute(text("ALTER TABLE steps DETACH PARTITION steps_default"))
+            await connection.execute(create_partition)
+            await connection.execute(text(
+                f"WITH moved AS (DELETE FROM steps_default WHERE {in_range} RETURNING {columns}) "
+                f"INSERT INTO {partition} ({columns}) SELECT {columns} FROM moved"
+            ))
+            await connection.execute(text("ALTER TABLE steps ATTACH PARTITION steps_default DEFAULT"))
+            logger.info(f"🔁 Moved steps from steps_default into new partition {partition}")
+
+        await connection.execute(text("CREATE TABLE IF NOT EXISTS steps_default PARTITION OF steps DEFAULT"))
+
+    logger.info(f"✅ Steps partitions ensured through {_add_months(current_month, months_ahead):%Y-%m}")
+
+
+async def refresh_pipeline_analytics():
     """
-    Initialize database - create all tables.
+    Refresh the mv_pipeline_analytics materialized view.
 
-    Call this on app startup.
+    CONCURRENTLY keeps the old contents readable while the new ones are
+    computed, so analytics requests never wait on a refresh.
     """
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as connection:
+        await connection.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_pipeline_analytics"))
+
+
+async def init_db():
+    """
+    Initialize database - apply Alembic migrations up to head.
+
+    Called on app startup only when XRAY_AUTO_MIGRATE=1; otherwise run
+    `alembic upgrade head` as a deploy step. Alembic's env.py drives its own
+    event loop, so the upgrade runs in a worker thread.
+
+    A database created by create_all (before migrations) has the tables but
+    no alembic_version; it is stamped at the baseline revision (0000) first
+    so the upgrade converts it instead of re-creating the tables.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    alembic_config = Config(str(ALEMBIC_INI_PATH))
+    alembic_config.attributes["configure_logger"] = False
+
+    async with engine.connect() as connection:
+        tables = set(await connection.run_sync(lambda sync_connection: inspect(sync_connection).get_table_names()))
+    if "runs" in tables and "alembic_version" not in tables:
+        logger.warning("⚠️  Database predates migrations - stamping baseline revision 0000 before upgrading")
+        await asyncio.to_thread(command.stamp, alembic_config, "0000")
+
+    await asyncio.to_thread(command.upgrade, alembic_config, "head")
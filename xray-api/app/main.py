@@ -6,12 +6,16 @@ FastAPI application for receiving and querying X-Ray traces.
 Reference: IMPLEMENTATION_PLAN.md -> "API Backend"
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+import asyncio
 import logging
 
 from .config import settings
-from .database import init_db
+from .database import engine, ensure_step_partitions, init_db, refresh_pipeline_analytics
 from .routers import ingest, query
 
 # Configure logging
@@ -22,11 +26,79 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Background task that keeps future steps partitions created
+PARTITION_CHECK_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+async def _maintain_step_partitions():
+    """Ensure steps partitions now, then daily, so next month's partition exists before it's needed"""
+    while True:
+        try:
+            await ensure_step_partitions()
+        except Exception as e:
+            logger.error(f"❌ Failed to create steps partitions: {e}")
+        await asyncio.sleep(PARTITION_CHECK_INTERVAL_SECONDS)
+
+
+async def _refresh_pipeline_analytics():
+    """Periodically refresh the pipeline analytics materialized view"""
+    while True:
+        await asyncio.sleep(settings.analytics_refresh_seconds)
+        try:
+            await refresh_pipeline_analytics()
+        except Exception as e:
+            logger.error(f"❌ Failed to refresh pipeline analytics: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup/shutdown for the API.
+
+    Schema changes are applied by Alembic (`alembic upgrade head`) as a
+    deploy step, so startup does no DDL checks by default. Set
+    XRAY_AUTO_MIGRATE=1 to run the migrations on startup instead
+    (convenient for local development).
+    """
+    logger.info("Starting X-Ray API...")
+    logger.info(f"Database URL: {settings.database_url}")
+
+    if not settings.cursor_secret:
+        if settings.web_concurrency > 1:
+            raise RuntimeError(
+                f"CURSOR_SECRET must be set when running {settings.web_concurrency} workers - "
+                f"otherwise each worker signs step query cursors with its own key"
+            )
+        logger.warning(
+            "⚠️  CURSOR_SECRET is not set - step query cursors are signed with a random key "
+            "and stop working after a restart. Set it in production."
+        )
+
+    if settings.auto_migrate:
+        await init_db()
+
+    background_tasks = [
+        asyncio.create_task(_maintain_step_partitions()),
+        asyncio.create_task(_refresh_pipeline_analytics()),
+    ]
+
+    logger.info("✅ X-Ray API started successfully")
+
+    yield
+
+    logger.info("Shutting down X-Ray API...")
+    for task in background_tasks:
+        task.cancel()
+    await engine.dispose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description=settings.app_description,
+    default_response_class=ORJSONResponse,  # orjson encodes UUID/datetime natively in C
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -38,29 +110,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses (run details with candidates_data, step pages)
+# for clients that send Accept-Encoding: gzip
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compresslevel,
+)
+
 # Include routers
 app.include_router(ingest.router, prefix="/api", tags=["Ingest"])
 app.include_router(query.router, prefix="/api", tags=["Query"])
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup"""
-    logger.info("Starting X-Ray API...")
-    logger.info(f"Database URL: {settings.database_url}")
-
-    # Create tables if they don't exist
-    init_db()
-
-    logger.info("✅ X-Ray API started successfully")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    logger.info("Shutting down X-Ray API...")
-
-
 @app.get("/")
 async def root():
     """Health check endpoint"""
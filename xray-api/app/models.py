@@ -4,17 +4,25 @@ X-Ray API Database Models (SQLAlchemy)
 These are the database table definitions using SQLAlchemy ORM.
 
 Key design decisions:
-- Two tables: runs and steps (simple hierarchy)
+- Two tables: runs and steps (simple hierarchy), plus a small per-pipeline
+  step-type rollup maintained on ingest
 - JSONB columns for flexible data (inputs, outputs, metadata, etc.)
+- Sampled candidate data lives in object storage; steps only keep its URI
+- steps is RANGE-partitioned by start_time (monthly) so recent-run queries
+  only touch the newest partition's indexes
 - Indexes on commonly queried fields (pipeline_name, status, step_type, timestamps)
+- Stored generated column for reduction_rate (computed by Postgres, never written)
+- GIN (jsonb_path_ops) indexes on step JSONB columns and run metadata for containment queries
 - Foreign key from steps to runs for relationship
+- UUID ids default to gen_random_uuid() server-side when the client sends none
 
 Reference: IMPLEMENTATION_PLAN.md -> "Database Schema"
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, Enum as SQLEnum, Float
+from sqlalchemy import BigInteger, Column, Computed, desc, text, String, Integer, DateTime, ForeignKey, Index, Enum as SQLEnum, Float
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.sql import column, table
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 import enum
 
@@ -60,7 +68,7 @@ class Run(Base):
     __tablename__ = "runs"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, server_default=text("gen_random_uuid()"))
 
     # Pipeline identification
     pipeline_name = Column(String, nullable=False, index=True)
@@ -87,6 +95,9 @@ class Run(Base):
     __table_args__ = (
         Index("idx_run_pipeline_status", "pipeline_name", "status"),
         Index("idx_run_start_time", "start_time"),
+        # GIN index for metadata containment filters (metadata @> '{...}')
+        Index("ix_run_metadata_gin", "metadata", postgresql_using="gin",
+              postgresql_ops={"metadata": "jsonb_path_ops"}),
     )
 
 
@@ -99,8 +110,14 @@ class Step(Base):
     """
     __tablename__ = "steps"
 
-    # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True)
+    # Primary key - includes start_time because the table is partitioned on it
+    # (Postgres requires the partition key in every unique constraint).
+    # So id alone is NOT unique in the database: two steps may share an id if
+    # their start_time differs. Ids are uuid4s generated by the SDK (or
+    # gen_random_uuid()), and ingest never re-inserts a stored run's steps,
+    # so that only happens if a client sends the same step id under two runs
+    # (whose candidate blobs, keyed by step id, would then overwrite each other).
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, server_default=text("gen_random_uuid()"))
 
     # Foreign key to run
     run_id = Column(UUID(as_uuid=True), ForeignKey("runs.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -110,19 +127,30 @@ class Step(Base):
     step_type = Column(SQLEnum(StepType), nullable=False, index=True)
     sequence = Column(Integer, default=0)
 
-    # Timing
-    start_time = Column(DateTime, nullable=True)
+    # Timing (start_time is the partition key - ingest falls back to the run's start_time)
+    start_time = Column(DateTime, primary_key=True, nullable=False)
     end_time = Column(DateTime, nullable=True)
 
     # Flexible data stored as JSONB
-    inputs = Column(JSONB, default={})
-    outputs = Column(JSONB, default={})
+    # Deferred: potentially large, so ORM loads of Step skip them unless undefer()'d
+    inputs = deferred(Column(JSONB, default={}))
+    outputs = deferred(Column(JSONB, default={}))
     reasoning = Column(String, default="")
 
     # Candidate tracking
     candidates_in = Column(Integer, nullable=True, index=True)
     candidates_out = Column(Integer, nullable=True, index=True)
-    candidates_data = Column(JSONB, nullable=True)  # Sampled candidate data
+    candidates_data_uri = Column(String, nullable=True)  # Sampled candidate data, stored out-of-line (see services/candidate_store.py)
+    candidates_data = deferred(Column(JSONB, nullable=True))  # Legacy inline samples from before the candidate store; NULL for new rows
+
+    # Fraction of candidates eliminated - matches SDK StepModel.reduction_rate.
+    # Stored generated column so it can be filtered/sorted/aggregated in SQL.
+    # NULL when candidates_in is NULL or 0.
+    reduction_rate = Column(
+        Float,
+        Computed("(candidates_in - candidates_out)::float / NULLIF(candidates_in, 0)", persisted=True),
+        index=True,
+    )
 
     # Filter tracking
     filters_applied = Column(JSONB, default={})
@@ -142,4 +170,55 @@ class Step(Base):
         Index("idx_step_type", "step_type"),
         Index("idx_step_name", "step_name"),
         Index("idx_step_candidates", "candidates_in", "candidates_out"),
+        # Keyset pagination order for /steps/query (newest first)
+        Index("ix_step_starttime_id", desc("start_time"), desc("id")),
+        # Equality filter + keyset order, so filtered pages are one range scan too
+        Index("ix_step_type_start", "step_type", desc("start_time"), desc("id")),
+        Index("ix_step_name_start", "step_name", desc("start_time"), desc("id")),
+        # GIN indexes for JSONB containment queries (filters_applied @> '{...}')
+        # jsonb_path_ops is smaller and faster than the default opclass for @>
+        Index("idx_step_filters_gin", "filters_applied", postgresql_using="gin",
+              postgresql_ops={"filters_applied": "jsonb_path_ops"}),
+        Index("idx_step_inputs_gin", "inputs", postgresql_using="gin",
+              postgresql_ops={"inputs": "jsonb_path_ops"}),
+        Index("idx_step_outputs_gin", "outputs", postgresql_using="gin",
+              postgresql_ops={"outputs": "jsonb_path_ops"}),
+        Index("idx_step_metadata_gin", "metadata", postgresql_using="gin",
+              postgresql_ops={"metadata": "jsonb_path_ops"}),
+        # Monthly RANGE partitions (steps_YYYY_MM) - see database.ensure_step_partitions
+        {"postgresql_partition_by": "RANGE (start_time)"},
     )
+
+
+class PipelineStepTypeCount(Base):
+    """
+    Rollup table - number of steps per (pipeline, step type).
+
+    Incremented in the ingest transaction (INSERT ... ON CONFLICT DO UPDATE),
+    so analytics can read steps_by_type with one small indexed lookup
+    instead of scanning steps.
+    """
+    __tablename__ = "pipeline_step_type_counts"
+
+    pipeline_name = Column(String, primary_key=True)
+    step_type = Column(SQLEnum(StepType), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+
+# =============================================================================
+# VIEWS - Read-only, maintained by migrations (not part of Base.metadata)
+# =============================================================================
+
+
+# Per-pipeline analytics, precomputed by the mv_pipeline_analytics materialized
+# view (alembic 0004, steps_by_type from pipeline_step_type_counts since 0005) and refreshed periodically - see database.refresh_pipeline_analytics
+pipeline_analytics_view = table(
+    "mv_pipeline_analytics",
+    column("pipeline_name", String),
+    column("total_runs", Integer),
+    column("success_count", Integer),
+    column("failure_count", Integer),
+    column("avg_duration_ms", Float),
+    column("total_steps", Integer),
+    column("steps_by_type", JSONB),
+)
@@ -7,24 +7,188 @@ Reference: IMPLEMENTATION_PLAN.md -> "Ingest Endpoint"
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
+from collections import Counter
 import logging
 
-from ..database import get_db
-from ..schemas import IngestPayload, IngestResponse
+from ..config import settings
+from ..database import copy_rows, get_db, pipeline
+from ..schemas import BatchIngestResponse, IngestPayload, IngestResponse, RunSchema, StepSchema
+from ..services.candidate_store import get_candidate_store
+from .query import invalidate_pipeline_analytics
 from .. import models
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# API enum value -> DB enum member, so the per-step conversion is a dict lookup
+_STEP_TYPES = {e.value: e for e in models.StepType}
+_RUN_STATUSES = {e.value: e for e in models.RunStatus}
+
+
+def _build_run_row(run_data: RunSchema) -> Dict[str, Any]:
+    """Convert an ingested run into a plain row mapping for bulk INSERT."""
+    return {
+        "id": run_data.id,
+        "pipeline_name": run_data.pipeline_name,
+        "pipeline_version": run_data.pipeline_version,
+        "start_time": run_data.start_time,
+        "end_time": run_data.end_time,
+        "status": _RUN_STATUSES[run_data.status.value],
+        "run_metadata": run_data.metadata,  # Note: using run_metadata attribute
+        "final_output": run_data.final_output,
+    }
+
+
+def _build_step_row(
+    step_data: StepSchema,
+    run_data: RunSchema,
+    candidates_data_uri: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Convert an ingested step into a plain row mapping for bulk INSERT.
+
+    Keys are ORM attribute names (e.g. step_metadata), so the list of rows
+    can be passed straight to db.execute(insert(models.Step), rows).
+    candidates_data itself is not stored in the row - only the URI of the
+    blob it was uploaded to.
+
+    start_time is the steps partition key and must be set, so steps without
+    one inherit their run's start_time.
+    """
+    return {
+        "id": step_data.id,
+        "run_id": run_data.id,
+        "step_name": step_data.step_name,
+        "step_type": _STEP_TYPES[step_data.step_type.value],
+        "sequence": step_data.sequence,
+        "start_time": step_data.start_time or run_data.start_time,
+        "end_time": step_data.end_time,
+        "inputs": step_data.inputs or {},
+        "outputs": step_data.outputs or {},
+        "reasoning": step_data.reasoning,
+        "candidates_in": step_data.candidates_in,
+        "candidates_out": step_data.candidates_out,
+        "candidates_data_uri": candidates_data_uri,
+        "filters_applied": step_data.filters_applied or {},
+        "step_metadata": step_data.metadata,  # Note: using step_metadata attribute
+    }
+
+
+def _build_step_type_count_rows(payloads: List[IngestPayload]) -> List[Dict[str, Any]]:
+    """
+    Count ingested steps per (pipeline, step type) for the rollup table.
+
+    Sorted by key so concurrent ingests upsert the same rows in the same
+    order and can't deadlock on each other.
+    """
+    counts = Counter(
+        (payload.run.pipeline_name, step_data.step_type.value)
+        for payload in payloads
+        for step_data in payload.steps
+    )
+    return [
+        {"pipeline_name": pipeline_name, "step_type": _STEP_TYPES[step_type], "count": count}
+        for (pipeline_name, step_type), count in sorted(counts.items())
+    ]
+
+
+# Runs already stored (a retried send) are skipped; RETURNING yields only the new ids
+_insert_new_runs = (
+    pg_insert(models.Run)
+    .on_conflict_do_nothing(index_elements=[models.Run.id])
+    .returning(models.Run.id)
+)
+
+# Add ingested counts onto the existing rollup rows
+_upsert_step_type_counts = pg_insert(models.PipelineStepTypeCount)
+_upsert_step_type_counts = _upsert_step_type_counts.on_conflict_do_update(
+    index_elements=[models.PipelineStepTypeCount.pipeline_name, models.PipelineStepTypeCount.step_type],
+    set_={"count": models.PipelineStepTypeCount.count + _upsert_step_type_counts.excluded["count"]},
+)
+
+
+async def _persist_payloads(db: AsyncSession, payloads: List[IngestPayload]) -> int:
+    """
+    Insert runs and their steps using one multi-row INSERT per table.
+
+    Ingest is idempotent per run: runs whose id is already stored (the SDK
+    retried a send whose response was lost) are skipped together with their
+    steps, so a retry neither fails on the primary key nor double-counts the
+    rollup. The same holds within a batch: a run id sent twice is only
+    ingested once (the first copy wins).
+
+    Runs are inserted first, which both satisfies the steps' foreign keys
+    and tells us which runs are new. Candidate data for the new steps is
+    then uploaded to the candidate store (concurrently), so the rows can
+    reference it. If the transaction then fails the blobs are left
+    orphaned, which is harmless - nothing points at them.
+
+    Step statements are pipelined so they cost about one roundtrip.
+    Large batches of steps (> COPY_INGEST_THRESHOLD) are bulk-loaded with
+    COPY instead, which is faster than INSERT for that many wide rows.
+    The pipeline_step_type_counts rollup is updated in the same transaction.
+    Does not commit - the caller owns the transaction.
+
+    Returns:
+        Number of steps inserted
+    """
+    # ON CONFLICT only sees rows already in the table, so both copies of a
+    # repeated run id would come back as new and their steps go in twice
+    unique_payloads = {}
+    for payload in payloads:
+        unique_payloads.setdefault(payload.run.id, payload)
+    if len(unique_payloads) < len(payloads):
+        logger.info(f"🔁 Skipped {len(payloads) - len(unique_payloads)} duplicate run(s) in batch")
+        payloads = list(unique_payloads.values())
+
+    run_rows = [_build_run_row(payload.run) for payload in payloads]
+    new_run_ids = set((await db.execute(_insert_new_runs, run_rows)).scalars().all()) if run_rows else set()
+
+    if len(new_run_ids) < len(payloads):
+        logger.info(f"🔁 Skipped {len(payloads) - len(new_run_ids)} already-ingested run(s)")
+        payloads = [payload for payload in payloads if payload.run.id in new_run_ids]
+
+    steps = [(step_data, payload.run) for payload in payloads for step_data in payload.steps]
+    to_upload = [(step_data.id, step_data.candidates_data) for step_data, _ in steps if step_data.candidates_data]
+    uploaded_uris = await get_candidate_store().put_many(to_upload) if to_upload else []
+    candidate_uris = dict(zip((step_id for step_id, _ in to_upload), uploaded_uris))
+
+    step_rows = [
+        _build_step_row(step_data, run_data, candidate_uris.get(step_data.id))
+        for step_data, run_data in steps
+    ]
+
+    if not step_rows:
+        return 0
+
+    count_rows = _build_step_type_count_rows(payloads)
+
+    if len(step_rows) > settings.copy_ingest_threshold:
+        # COPY can't run in pipeline mode
+        await copy_rows(db, models.Step, step_rows)
+        await db.execute(_upsert_step_type_counts, count_rows)
+    else:
+        async with pipeline(db):
+            await db.execute(insert(models.Step), step_rows)
+            await db.execute(_upsert_step_type_counts, count_rows)
+
+    return len(step_rows)
+
 
 @router.post("/runs/ingest", response_model=IngestResponse, status_code=status.HTTP_201_CREATED)
-async def ingest_trace(payload: IngestPayload, db: Session = Depends(get_db)):
+async def ingest_trace(payload: IngestPayload, db: AsyncSession = Depends(get_db)):
     """
     Ingest a complete trace (run + steps) from the SDK.
 
-    This is the main endpoint that the SDK sends data to.
+    This is the main endpoint that the SDK sends data to. Re-sending a
+    trace whose run is already stored succeeds without writing anything,
+    so SDK retries are safe. Rows that conflict otherwise return 409.
 
     Args:
         payload: Complete run with all steps
@@ -55,44 +219,14 @@ async def ingest_trace(payload: IngestPayload, db: Session = Depends(get_db)):
         }
     """
     try:
-        # Create Run record
-        db_run = models.Run(
-            id=payload.run.id,
-            pipeline_name=payload.run.pipeline_name,
-            pipeline_version=payload.run.pipeline_version,
-            start_time=payload.run.start_time,
-            end_time=payload.run.end_time,
-            status=models.RunStatus(payload.run.status.value),
-            run_metadata=payload.run.metadata,  # Note: using run_metadata attribute
-            final_output=payload.run.final_output,
-        )
-
-        # Add to session
-        db.add(db_run)
-
-        # Create Step records
-        for step_data in payload.steps:
-            db_step = models.Step(
-                id=step_data.id,
-                run_id=payload.run.id,
-                step_name=step_data.step_name,
-                step_type=models.StepType(step_data.step_type.value),
-                sequence=step_data.sequence,
-                start_time=step_data.start_time,
-                end_time=step_data.end_time,
-                inputs=step_data.inputs,
-                outputs=step_data.outputs,
-                reasoning=step_data.reasoning,
-                candidates_in=step_data.candidates_in,
-                candidates_out=step_data.candidates_out,
-                candidates_data=step_data.candidates_data,
-                filters_applied=step_data.filters_applied,
-                step_metadata=step_data.metadata,  # Note: using step_metadata attribute
-            )
-            db.add(db_step)
+        # Insert the Run and all of its Steps (one INSERT per table,
+        # bypassing per-object unit-of-work bookkeeping)
+        await _persist_payloads(db, [payload])
 
         # Commit transaction
-        db.commit()
+        await db.commit()
+
+        invalidate_pipeline_analytics(payload.run.pipeline_name)
 
         logger.info(f"✅ Ingested trace for run {payload.run.id} ({payload.run.pipeline_name}) with {len(payload.steps)} steps")
 
@@ -103,10 +237,100 @@ async def ingest_trace(payload: IngestPayload, db: Session = Depends(get_db)):
             steps_count=len(payload.steps),
         )
 
+    except IntegrityError as e:
+        # e.g. a step id that already belongs to another run - retrying can't help
+        await db.rollback()
+        logger.error(f"❌ Conflicting trace: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Conflicting trace: {str(e)}"
+        )
+
+    except DataError as e:
+        # Values the database rejects (e.g. out-of-range numbers) - a client error
+        await db.rollback()
+        logger.error(f"❌ Invalid trace: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid trace: {str(e)}"
+        )
+
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"❌ Failed to ingest trace: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to ingest trace: {str(e)}"
         )
+
+
+@router.post("/runs/ingest:batch", response_model=BatchIngestResponse, status_code=status.HTTP_201_CREATED)
+async def ingest_trace_batch(payloads: List[IngestPayload], db: AsyncSession = Depends(get_db)):
+    """
+    Ingest several complete traces in a single request.
+
+    All runs and steps are written in one transaction, so a client that
+    buffers traces pays for one HTTP roundtrip and one commit per batch
+    instead of one per run. The batch is all-or-nothing.
+
+    Like the single-trace endpoint, runs that are already stored are
+    skipped, so re-sending a batch is safe.
+
+    Args:
+        payloads: List of complete runs with their steps
+        db: Database session (injected)
+
+    Returns:
+        Confirmation response with all run IDs
+
+    Example request:
+        POST /api/runs/ingest:batch
+        [
+            {"run": {...}, "steps": [...]},
+            {"run": {...}, "steps": [...]}
+        ]
+    """
+    try:
+        steps_count = await _persist_payloads(db, payloads)
+
+        # Commit the whole batch at once
+        await db.commit()
+
+        for pipeline_name in {payload.run.pipeline_name for payload in payloads}:
+            invalidate_pipeline_analytics(pipeline_name)
+
+        logger.info(f"✅ Ingested batch of {len(payloads)} traces with {steps_count} steps")
+
+        return BatchIngestResponse(
+            success=True,
+            run_ids=[payload.run.id for payload in payloads],
+            message="Traces ingested successfully",
+            runs_count=len(payloads),
+            steps_count=steps_count,
+        )
+
+    except IntegrityError as e:
+        # e.g. a step id that already belongs to another run - retrying can't help
+        await db.rollback()
+        logger.error(f"❌ Conflicting trace batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Conflicting trace batch: {str(e)}"
+        )
+
+    except DataError as e:
+        # Values the database rejects (e.g. out-of-range numbers) - a client error
+        await db.rollback()
+        logger.error(f"❌ Invalid trace batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid trace batch: {str(e)}"
+        )
+
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"❌ Failed to ingest trace batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to ingest trace batch: {str(e)}"
+        )
@@ -8,22 +8,35 @@ This is where the debugging power comes from!
 Reference: IMPLEMENTATION_PLAN.md -> "Query Endpoints"
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
-from typing import Optional, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Float, String, bindparam, func, literal, select, tuple_, and_, or_
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple
+from cachetools import LRUCache, TTLCache
+from datetime import datetime
+from uuid import UUID
+import asyncio
+import base64
+import hashlib
+import hmac
 import logging
+import orjson
+import secrets
+import time
 
-from ..database import get_db
+from ..database import SessionLocal, estimate_row_count, get_db
 from ..schemas import (
-    RunSchema,
-    StepSchema,
     RunDetailResponse,
     RunListResponse,
+    StepCountEstimate,
     StepListResponse,
     StepQueryFilter,
+    StepStatsBucket,
+    StepStatsResponse,
     AnalyticsResponse,
 )
+from ..services.candidate_store import get_candidate_store
 from .. import models
 from ..config import settings
 
@@ -31,6 +44,258 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Read once at import - used by every paginated endpoint
+MAX_PAGE_SIZE = settings.max_page_size
+
+# Steps fetched per server-side cursor batch (run detail / NDJSON stream)
+STEP_BATCH_SIZE = 100
+NDJSON_BATCH_SIZE = 50
+
+# Valid ?status= values, checked by set membership instead of try/except
+_RUN_STATUS_VALUES = frozenset(s.value for s in models.RunStatus)
+
+# Key for signing pagination cursors. Without CURSOR_SECRET a random per-process
+# key is used, so cursors only work against the worker that issued them (the
+# lifespan handler warns about this, and refuses to start with several workers).
+_CURSOR_KEY = settings.cursor_secret.encode() if settings.cursor_secret else secrets.token_bytes(32)
+
+# API enum value -> DB enum member (same mapping as the ingest router)
+_STEP_TYPES = {e.value: e for e in models.StepType}
+
+# Serialized detail responses for finished runs: run_id -> (etag, json bytes).
+# Finished runs never change after ingest, so entries never go stale.
+# Keyed by (run_id, included heavy fields), since those change the body.
+_run_cache: LRUCache = LRUCache(maxsize=settings.run_cache_size)
+
+# Pipeline analytics responses: pipeline_name -> (AnalyticsResponse, computed live).
+# Expire after ANALYTICS_CACHE_TTL_SECONDS; live-computed ones are also dropped
+# on ingest. This is per-process - with several workers each one holds (and
+# expires) its own copy.
+_analytics_cache: TTLCache = TTLCache(
+    maxsize=settings.analytics_cache_size,
+    ttl=settings.analytics_cache_ttl_seconds,
+)
+
+
+def invalidate_pipeline_analytics(pipeline_name: str) -> None:
+    """
+    Drop a pipeline's cached analytics if they were computed live (called after ingest).
+
+    Live results read the tables, so the next request sees the new run.
+    Results served from mv_pipeline_analytics are kept: recomputing them
+    would read the same view rows until its next refresh, so they are left
+    to expire with the TTL.
+    """
+    entry = _analytics_cache.get(pipeline_name)
+    if entry is not None and entry[1]:
+        _analytics_cache.pop(pipeline_name, None)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (may list several ETags) against an ETag"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates or "*" in candidates
+
+
+# =============================================================================
+# ROW SERIALIZATION - Build response dicts straight from DB rows
+# =============================================================================
+
+# Rows come from our own database, so re-validating them through Pydantic is
+# pure overhead. Read endpoints select these columns and build plain dicts
+# that orjson serializes directly (UUID, datetime and enums are native).
+
+_RUN_SUMMARY_COLUMNS = (
+    models.Run.id,
+    models.Run.pipeline_name,
+    models.Run.pipeline_version,
+    models.Run.start_time,
+    models.Run.end_time,
+    models.Run.status,
+)
+
+_RUN_COLUMNS = _RUN_SUMMARY_COLUMNS + (
+    models.Run.run_metadata,
+    models.Run.final_output,
+)
+
+_STEP_COLUMNS = (
+    models.Step.id,
+    models.Step.run_id,
+    models.Step.step_name,
+    models.Step.step_type,
+    models.Step.sequence,
+    models.Step.start_time,
+    models.Step.end_time,
+    models.Step.reasoning,
+    models.Step.candidates_in,
+    models.Step.candidates_out,
+    models.Step.reduction_rate,
+    models.Step.filters_applied,
+    models.Step.step_metadata,
+)
+
+# Potentially large JSONB step columns - only loaded when asked for
+_STEP_HEAVY_COLUMNS = {
+    "inputs": models.Step.inputs,
+    "outputs": models.Step.outputs,
+    "candidates_data": models.Step.candidates_data_uri,  # Blob fetched from the candidate store
+}
+
+
+def _run_summary_to_dict(row) -> Dict[str, Any]:
+    """Convert a run row (selected with _RUN_SUMMARY_COLUMNS) to a RunSummarySchema-shaped dict"""
+    return {
+        "id": row.id,
+        "pipeline_name": row.pipeline_name,
+        "pipeline_version": row.pipeline_version,
+        "start_time": row.start_time,
+        "end_time": row.end_time,
+        "status": row.status,
+    }
+
+
+def _run_to_dict(row) -> Dict[str, Any]:
+    """Convert a run row (selected with _RUN_COLUMNS) to a RunSchema-shaped dict"""
+    run = _run_summary_to_dict(row)
+    run["metadata"] = row.run_metadata or {}
+    run["final_output"] = row.final_output
+    return run
+
+
+def _step_to_dict(row) -> Dict[str, Any]:
+    """
+    Convert a step row (selected with _STEP_COLUMNS plus any heavy columns)
+    to a StepSchema-shaped dict. Heavy columns are included only if selected.
+    """
+    step = {
+        "id": row.id,
+        "run_id": row.run_id,
+        "step_name": row.step_name,
+        "step_type": row.step_type,
+        "sequence": row.sequence,
+        "start_time": row.start_time,
+        "end_time": row.end_time,
+        "reasoning": row.reasoning or "",
+        "candidates_in": row.candidates_in,
+        "candidates_out": row.candidates_out,
+        "reduction_rate": row.reduction_rate,
+        "filters_applied": row.filters_applied or {},
+        "metadata": row.step_metadata or {},
+    }
+    fields = row._mapping
+    for name in ("inputs", "outputs"):
+        if name in fields:
+            step[name] = fields[name]
+    return step
+
+
+def _parse_include(include: Optional[str]) -> Tuple[str, ...]:
+    """Parse ?include=a,b into a sorted tuple of heavy step column names"""
+    if not include:
+        return ()
+    names = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = names - _STEP_HEAVY_COLUMNS.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid include field(s): {', '.join(sorted(unknown))}. "
+                   f"Allowed: {', '.join(_STEP_HEAVY_COLUMNS)}"
+        )
+    return tuple(sorted(names))
+
+
+async def _iter_step_batches(
+    db: AsyncSession,
+    run_id: UUID,
+    included: Tuple[str, ...],
+    batch_size: int,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield a run's steps (in sequence order) as lists of StepSchema-shaped dicts.
+
+    Rows come from a server-side cursor `batch_size` at a time, so only one
+    batch of raw rows (with their JSONB payloads) is held at once. If
+    candidates_data is included, each batch's blobs are fetched in parallel.
+    """
+    step_columns = _STEP_COLUMNS + tuple(_STEP_HEAVY_COLUMNS[name] for name in included)
+    if "candidates_data" in included:
+        step_columns += (models.Step.candidates_data,)  # Legacy inline samples
+    result = await db.stream(
+        select(*step_columns)
+        .where(models.Step.run_id == run_id)
+        .order_by(models.Step.sequence)
+        .execution_options(yield_per=batch_size)
+    )
+
+    async for rows in result.partitions():
+        steps = [_step_to_dict(row) for row in rows]
+
+        # Candidate data lives out-of-line; rows ingested before the candidate
+        # store have no URI and still carry their samples inline
+        if "candidates_data" in included:
+            blobs = await get_candidate_store().get_many([row.candidates_data_uri for row in rows])
+            for step, row, blob in zip(steps, rows, blobs):
+                step["candidates_data"] = blob if row.candidates_data_uri else row.candidates_data
+
+        yield steps
+
+
+# =============================================================================
+# PAGINATION CURSORS
+# =============================================================================
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _encode_cursor(start_time: datetime, step_id: UUID) -> str:
+    """
+    Encode a keyset position as an opaque, HMAC-signed token.
+
+    Format: base64url(json [start_time, id, issued_at]) "." base64url(signature)
+    """
+    payload = orjson.dumps([start_time.isoformat(), str(step_id), int(time.time())])
+    signature = hmac.new(_CURSOR_KEY, payload, hashlib.sha256).digest()[:16]
+    return f"{_b64encode(payload)}.{_b64encode(signature)}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Verify and decode a cursor produced by _encode_cursor.
+
+    Raises:
+        HTTPException(400): If the cursor is malformed, its signature doesn't
+            match, or it is older than CURSOR_TTL_SECONDS
+    """
+    try:
+        encoded_payload, encoded_signature = cursor.split(".")
+        payload = _b64decode(encoded_payload)
+        expected = hmac.new(_CURSOR_KEY, payload, hashlib.sha256).digest()[:16]
+        if not hmac.compare_digest(expected, _b64decode(encoded_signature)):
+            raise ValueError("bad signature")
+        start_time, step_id, issued_at = orjson.loads(payload)
+        position = datetime.fromisoformat(start_time), UUID(step_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    if time.time() - issued_at > settings.cursor_ttl_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expired cursor - restart from the first page"
+        )
+    return position
+
 
 # =============================================================================
 # RUN QUERIES
@@ -38,14 +303,32 @@ router = APIRouter()
 
 
 @router.get("/runs/{run_id}", response_model=RunDetailResponse)
-async def get_run_by_id(run_id: str, db: Session = Depends(get_db)):
+async def get_run_by_id(
+    run_id: UUID,
+    request: Request,
+    include: Optional[str] = Query(
+        None,
+        description="Comma-separated heavy step fields to include: inputs, outputs, candidates_data"
+    ),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Get a specific run with all its steps.
 
     This is used for detailed debugging of a specific run.
 
+    The large JSONB step fields (inputs, outputs, candidates_data) are left
+    out by default; request them with ?include=inputs,outputs,candidates_data.
+
+    Finished runs are immutable, so their serialized response is kept in an
+    in-process LRU cache and served without touching the database. Every
+    response carries an ETag; clients sending it back in If-None-Match
+    get 304 Not Modified.
+
     Args:
         run_id: UUID of the run
+        request: Incoming request (for If-None-Match)
+        include: Heavy step fields to include
         db: Database session
 
     Returns:
@@ -53,9 +336,80 @@ async def get_run_by_id(run_id: str, db: Session = Depends(get_db)):
 
     Example:
         GET /api/runs/abc-123
+        GET /api/runs/abc-123?include=candidates_data
+    """
+    included = _parse_include(include)
+    # run_id is parsed by FastAPI, so case/hyphen variants of one id share an entry
+    cache_key = (run_id, included)
+    cached: Optional[Tuple[str, bytes]] = _run_cache.get(cache_key)
+
+    if cached is not None:
+        etag, body = cached
+    else:
+        # Query run
+        result = await db.execute(select(*_RUN_COLUMNS).where(models.Run.id == run_id))
+        db_run = result.first()
+
+        if not db_run:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Run {run_id} not found"
+            )
+
+        # Query steps (ordered by sequence), converting each batch as it arrives
+        steps = []
+        async for batch in _iter_step_batches(db, run_id, included, STEP_BATCH_SIZE):
+            steps.extend(batch)
+
+        body = orjson.dumps({
+            "run": _run_to_dict(db_run),
+            "steps": steps,
+        })
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+        # Only finished runs are safe to cache - running ones may be re-read
+        if db_run.status != models.RunStatus.RUNNING:
+            _run_cache[cache_key] = (etag, body)
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@router.get("/runs/{run_id}/steps.ndjson", response_class=StreamingResponse)
+async def stream_run_steps(
+    run_id: UUID,
+    include: Optional[str] = Query(
+        None,
+        description="Comma-separated heavy step fields to include: inputs, outputs, candidates_data"
+    ),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    # Query run
-    db_run = db.query(models.Run).filter(models.Run.id == run_id).first()
+    Stream a run and its steps as NDJSON (one JSON object per line).
+
+    The first line is the run, followed by one line per step in sequence
+    order. Steps are read from a server-side cursor in batches, so server
+    memory stays bounded and clients can start processing early steps
+    before the whole run has been sent.
+
+    Args:
+        run_id: UUID of the run
+        include: Heavy step fields to include (same as GET /runs/{run_id})
+        db: Database session (used for the existence check only)
+
+    Returns:
+        application/x-ndjson stream
+
+    Example:
+        GET /api/runs/abc-123/steps.ndjson?include=outputs
+    """
+    included = _parse_include(include)
+
+    # Check the run exists up front so a missing run is a proper 404
+    result = await db.execute(select(*_RUN_COLUMNS).where(models.Run.id == run_id))
+    db_run = result.first()
 
     if not db_run:
         raise HTTPException(
@@ -63,34 +417,37 @@ async def get_run_by_id(run_id: str, db: Session = Depends(get_db)):
             detail=f"Run {run_id} not found"
         )
 
-    # Query steps (ordered by sequence)
-    db_steps = db.query(models.Step)\
-        .filter(models.Step.run_id == run_id)\
-        .order_by(models.Step.sequence)\
-        .all()
+    async def generate_lines():
+        yield orjson.dumps(_run_to_dict(db_run)) + b"\n"
 
-    return RunDetailResponse(
-        run=RunSchema.model_validate(db_run),
-        steps=[StepSchema.model_validate(step) for step in db_steps]
-    )
+        # The request's session is closed once the handler returns, so the
+        # stream needs its own for the lifetime of the response
+        async with SessionLocal() as stream_db:
+            async for steps in _iter_step_batches(stream_db, run_id, included, NDJSON_BATCH_SIZE):
+                yield b"".join(orjson.dumps(step) + b"\n" for step in steps)
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
 
 
 @router.get("/runs", response_model=RunListResponse)
 async def list_runs(
     pipeline_name: Optional[str] = Query(None, description="Filter by pipeline name"),
-    status: Optional[str] = Query(None, description="Filter by status (running, success, failure)"),
-    limit: int = Query(50, ge=1, le=settings.max_page_size, description="Number of results"),
+    run_status: Optional[str] = Query(None, alias="status", description="Filter by status (running, success, failure)"),
+    metadata: Optional[str] = Query(None, description='JSON object the run metadata must contain, e.g. {"env": "prod"}'),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE, description="Number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     List runs with optional filtering.
 
-    Supports pagination and basic filtering.
+    Supports pagination and basic filtering. Returns run summaries only -
+    metadata and final_output are never read here; fetch a run by ID for those.
 
     Args:
         pipeline_name: Filter by pipeline name
-        status: Filter by status
+        run_status: Filter by status (query parameter "status")
+        metadata: JSON object matched by containment against run metadata
         limit: Page size
         offset: Page offset
         db: Database session
@@ -101,38 +458,59 @@ async def list_runs(
     Example:
         GET /api/runs?pipeline_name=competitor_selection&status=success&limit=20
     """
-    # Build query
-    query = db.query(models.Run)
+    # Build query - the window count returns the filtered total on every row,
+    # so the page and the total come back in a single roundtrip
+    query = select(*_RUN_SUMMARY_COLUMNS, func.count().over().label("total"))
 
     # Apply filters
     if pipeline_name:
         query = query.filter(models.Run.pipeline_name == pipeline_name)
 
-    if status:
-        try:
-            status_enum = models.RunStatus(status)
-            query = query.filter(models.Run.status == status_enum)
-        except ValueError:
+    if run_status:
+        if run_status not in _RUN_STATUS_VALUES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status: {status}"
+                detail=f"Invalid status: {run_status}"
             )
+        query = query.filter(models.Run.status == models.RunStatus(run_status))
 
-    # Get total count
-    total = query.count()
+    if metadata:
+        try:
+            metadata_filter = orjson.loads(metadata)
+        except orjson.JSONDecodeError:
+            metadata_filter = None
+        if not isinstance(metadata_filter, dict):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="metadata must be a JSON object"
+            )
+        # JSONB containment (served by ix_run_metadata_gin)
+        query = query.filter(models.Run.run_metadata.contains(metadata_filter))
 
     # Apply pagination and ordering
-    runs = query.order_by(models.Run.start_time.desc())\
-        .limit(limit)\
-        .offset(offset)\
-        .all()
-
-    return RunListResponse(
-        runs=[RunSchema.model_validate(run) for run in runs],
-        total=total,
-        page=offset // limit + 1,
-        page_size=limit
+    result = await db.execute(
+        query.order_by(models.Run.start_time.desc())
+        .limit(limit)
+        .offset(offset)
     )
+    runs = result.all()
+
+    if runs:
+        total = runs[0].total
+    elif offset > 0:
+        # Paged past the end - no row to carry the window count, so ask directly
+        total = await db.scalar(
+            query.with_only_columns(func.count(models.Run.id), maintain_column_froms=True)
+        )
+    else:
+        total = 0
+
+    return ORJSONResponse({
+        "runs": [_run_summary_to_dict(run) for run in runs],
+        "total": total,
+        "page": offset // limit + 1,
+        "page_size": limit,
+    })
 
 
 # =============================================================================
@@ -140,18 +518,80 @@ async def list_runs(
 # =============================================================================
 
 
+def _filter_steps(query, filter_params: StepQueryFilter):
+    """Apply StepQueryFilter conditions to a select() over steps"""
+    # Apply filters
+    if filter_params.step_type:
+        query = query.filter(models.Step.step_type == _STEP_TYPES[filter_params.step_type.value])
+
+    if filter_params.step_name:
+        query = query.filter(models.Step.step_name == filter_params.step_name)
+
+    if filter_params.pipeline_name:
+        # Join with runs table
+        query = query.join(models.Run).filter(models.Run.pipeline_name == filter_params.pipeline_name)
+
+    # Candidate filtering
+    if filter_params.min_candidates_in is not None:
+        query = query.filter(models.Step.candidates_in >= filter_params.min_candidates_in)
+
+    if filter_params.max_candidates_in is not None:
+        query = query.filter(models.Step.candidates_in <= filter_params.max_candidates_in)
+
+    if filter_params.min_candidates_out is not None:
+        query = query.filter(models.Step.candidates_out >= filter_params.min_candidates_out)
+
+    if filter_params.max_candidates_out is not None:
+        query = query.filter(models.Step.candidates_out <= filter_params.max_candidates_out)
+
+    # Reduction rate filtering - indexed generated column, NULL when candidates_in is 0/NULL
+    if filter_params.min_reduction_rate is not None:
+        query = query.filter(models.Step.reduction_rate >= filter_params.min_reduction_rate)
+
+    if filter_params.max_reduction_rate is not None:
+        query = query.filter(models.Step.reduction_rate <= filter_params.max_reduction_rate)
+
+    # JSONB containment filtering (served by idx_step_filters_gin)
+    if filter_params.filters_applied:
+        query = query.filter(models.Step.filters_applied.contains(filter_params.filters_applied))
+
+    # Time range filtering
+    if filter_params.start_time_from:
+        query = query.filter(models.Step.start_time >= filter_params.start_time_from)
+
+    if filter_params.start_time_to:
+        query = query.filter(models.Step.start_time <= filter_params.start_time_to)
+
+    return query
+
+
 @router.post("/steps/query", response_model=StepListResponse)
 async def query_steps(
     filter_params: StepQueryFilter,
-    limit: int = Query(50, ge=1, le=settings.max_page_size),
-    offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    offset: Optional[int] = Query(
+        None,
+        ge=0,
+        deprecated=True,
+        description="Deprecated offset pagination (also returns total and page) - use cursor"
+    ),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Query steps across all pipelines.
 
     This is the powerful cross-pipeline query endpoint!
 
+    Results are ordered newest first and keyset-paginated: each page is one
+    index range scan on (start_time, id), however deep the page. Pass the
+    response's next_cursor back as ?cursor= (with the same filters).
+
+    ?offset= is still accepted for older clients: the page is then skipped
+    to with OFFSET and the response also carries the exact total (a COUNT
+    over the whole filter) and the page number. Both get slower the deeper
+    and broader the query, which is why cursors replaced them.
+
     Examples:
     - "Show me all LLM steps"
     - "Show me all FILTER steps that eliminated >90% candidates"
@@ -160,86 +600,181 @@ async def query_steps(
     Args:
         filter_params: Query filters
         limit: Page size
-        offset: Page offset
+        cursor: Opaque, signed pagination cursor
+        offset: Deprecated - rows to skip (can't be combined with cursor)
         db: Database session
 
     Returns:
-        Matching steps
+        Matching steps and the cursor for the next page
 
     Example request:
-        POST /api/steps/query
+        POST /api/steps/query?cursor=eyJ...
         {
             "step_type": "filter",
             "min_reduction_rate": 0.9
         }
     """
-    # Build query
-    query = db.query(models.Step)
 
-    # Apply filters
-    if filter_params.step_type:
-        query = query.filter(models.Step.step_type == models.StepType(filter_params.step_type.value))
+    # Build query - plain column rows, no ORM objects and no large JSONB
+    # payloads (inputs/outputs/candidates_data; fetch a run for those)
+    query = _filter_steps(select(*_STEP_COLUMNS), filter_params)
 
-    if filter_params.step_name:
-        query = query.filter(models.Step.step_name == filter_params.step_name)
+    if cursor and offset is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either cursor or offset, not both"
+        )
 
-    if filter_params.pipeline_name:
-        # Join with runs table
-        query = query.join(models.Run).filter(models.Run.pipeline_name == filter_params.pipeline_name)
+    total = page = None
+    if offset is not None:
+        # Deprecated offset pagination - exact total plus OFFSET
+        total = (await db.execute(
+            select(func.count()).select_from(_filter_steps(select(models.Step.id), filter_params).subquery())
+        )).scalar_one()
+        page = offset // limit + 1
+        query = query.offset(offset)
+
+    # Keyset pagination - continue strictly after the previous page's last row
+    if cursor:
+        cursor_start_time, cursor_id = _decode_cursor(cursor)
+        query = query.filter(
+            tuple_(models.Step.start_time, models.Step.id) < tuple_(cursor_start_time, cursor_id)
+        )
 
-    # Candidate filtering
-    if filter_params.min_candidates_in is not None:
-        query = query.filter(models.Step.candidates_in >= filter_params.min_candidates_in)
+    # Fetch one extra row to know whether there is a next page. Rows come
+    # from a server-side cursor in batches and are converted as they arrive,
+    # so large pages never hold every raw row at once.
+    result = await db.stream(
+        query.order_by(models.Step.start_time.desc(), models.Step.id.desc())
+        .limit(limit + 1)
+        .execution_options(yield_per=STEP_BATCH_SIZE)
+    )
 
-    if filter_params.max_candidates_in is not None:
-        query = query.filter(models.Step.candidates_in <= filter_params.max_candidates_in)
+    steps = []
+    has_more = False
+    async for rows in result.partitions():
+        for row in rows:
+            if len(steps) == limit:
+                has_more = True
+                break
+            steps.append(_step_to_dict(row))
+
+    next_cursor = None
+    if has_more:
+        next_cursor = _encode_cursor(steps[-1]["start_time"], steps[-1]["id"])
+
+    return ORJSONResponse({
+        "steps": steps,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+        "page_size": limit,
+        "total": total,
+        "page": page,
+    })
+
+
+@router.post("/steps/estimate_count", response_model=StepCountEstimate)
+async def estimate_step_count(
+    filter_params: StepQueryFilter,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Estimate how many steps match a query.
 
-    if filter_params.min_candidates_out is not None:
-        query = query.filter(models.Step.candidates_out >= filter_params.min_candidates_out)
+    /steps/query returns no total (counting re-runs the whole filter). When
+    a UI needs "about N results", this asks the Postgres planner instead -
+    one EXPLAIN, no scan. The number is approximate.
 
-    if filter_params.max_candidates_out is not None:
-        query = query.filter(models.Step.candidates_out <= filter_params.max_candidates_out)
+    Args:
+        filter_params: Same filters as /steps/query
+        db: Database session
 
-    # Reduction rate filtering (requires calculation)
-    if filter_params.min_reduction_rate is not None or filter_params.max_reduction_rate is not None:
-        # Calculate reduction rate: (candidates_in - candidates_out) / candidates_in
-        # Only consider steps with candidates_in > 0
-        query = query.filter(models.Step.candidates_in > 0)
-
-        if filter_params.min_reduction_rate is not None:
-            # (candidates_in - candidates_out) / candidates_in >= min_rate
-            # candidates_in - candidates_out >= min_rate * candidates_in
-            # candidates_out <= candidates_in * (1 - min_rate)
-            query = query.filter(
-                models.Step.candidates_out <= models.Step.candidates_in * (1 - filter_params.min_reduction_rate)
-            )
+    Returns:
+        Estimated number of matching steps
 
-        if filter_params.max_reduction_rate is not None:
-            query = query.filter(
-                models.Step.candidates_out >= models.Step.candidates_in * (1 - filter_params.max_reduction_rate)
-            )
+    Example:
+        POST /api/steps/estimate_count
+        {"step_type": "filter", "min_reduction_rate": 0.9}
+    """
+    query = _filter_steps(select(models.Step.id), filter_params)
+    return StepCountEstimate(estimated_count=await estimate_row_count(db, query))
+
+
+@router.get("/steps/stats", response_model=StepStatsResponse)
+async def get_step_stats(
+    step_name: str = Query(..., description="Step to aggregate"),
+    pipeline_name: Optional[str] = Query(None, description="Restrict to one pipeline"),
+    filter_key: Optional[str] = Query(
+        None,
+        description="filters_applied key to bucket by (e.g., category_similarity_threshold)"
+    ),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Aggregate statistics for a step across runs.
 
-    # Time range filtering
-    if filter_params.start_time_from:
-        query = query.filter(models.Step.start_time >= filter_params.start_time_from)
+    Answers "how did this step behave across runs, and how does that vary
+    with a filter setting?" without transferring any step rows - the
+    histogram is computed in Postgres with GROUP BY.
 
-    if filter_params.start_time_to:
-        query = query.filter(models.Step.start_time <= filter_params.start_time_to)
+    Args:
+        step_name: Step name to aggregate
+        pipeline_name: Optional pipeline filter
+        filter_key: Optional filters_applied key to bucket by
+        db: Database session
 
-    # Get total count
-    total = query.count()
+    Returns:
+        Total count, average reduction rate and per-value buckets
+
+    Example:
+        GET /api/steps/stats?step_name=filter_by_category&pipeline_name=competitor_selection&filter_key=category_similarity_threshold
+    """
+    # Stored generated column: (candidates_in - candidates_out) / candidates_in
+    reduction_rate = models.Step.reduction_rate
 
-    # Apply pagination
-    steps = query.order_by(models.Step.start_time.desc())\
-        .limit(limit)\
-        .offset(offset)\
-        .all()
+    if filter_key:
+        # Inline the key so SELECT and GROUP BY render the identical expression
+        bucket = models.Step.filters_applied.op("->>")(
+            bindparam("filter_key", filter_key, type_=String, literal_execute=True)
+        )
+    else:
+        bucket = literal(None, type_=String)
+    bucket = bucket.label("value")
+
+    query = select(
+        bucket,
+        func.count().label("count"),
+        func.avg(reduction_rate).label("avg_reduction_rate"),
+        func.count(reduction_rate).label("rated_count"),
+    ).filter(models.Step.step_name == step_name)
+
+    if pipeline_name:
+        query = query.join(models.Run).filter(models.Run.pipeline_name == pipeline_name)
 
-    return StepListResponse(
-        steps=[StepSchema.model_validate(step) for step in steps],
-        total=total,
-        page=offset // limit + 1,
-        page_size=limit
+    result = await db.execute(query.group_by(bucket).order_by(bucket))
+    rows = result.all()
+
+    # Overall average, weighted by the number of steps that had a rate
+    rated_total = sum(row.rated_count for row in rows)
+    avg_reduction = (
+        sum(row.avg_reduction_rate * row.rated_count for row in rows if row.rated_count) / rated_total
+        if rated_total else None
+    )
+
+    return StepStatsResponse(
+        step_name=step_name,
+        pipeline_name=pipeline_name,
+        filter_key=filter_key,
+        total_steps=sum(row.count for row in rows),
+        avg_reduction_rate=avg_reduction,
+        buckets=[
+            StepStatsBucket(
+                value=row.value,
+                count=row.count,
+                avg_reduction_rate=row.avg_reduction_rate,
+            )
+            for row in rows
+        ] if filter_key else [],
     )
 
 
@@ -248,8 +783,73 @@ async def query_steps(
 # =============================================================================
 
 
+async def _fetch_all(statement) -> List[Any]:
+    """Run a read-only statement on its own session, so several can run concurrently"""
+    async with SessionLocal() as session:
+        result = await session.execute(statement)
+        return result.all()
+
+
+async def _compute_pipeline_analytics(pipeline_name: str) -> Optional[AnalyticsResponse]:
+    """
+    Compute pipeline analytics live from runs and the step type rollup.
+
+    Used for pipelines that are not in mv_pipeline_analytics yet (first
+    runs since the last refresh). The two aggregate queries are independent,
+    so they run concurrently on separate connections (one AsyncSession
+    cannot run two statements at once).
+
+    Returns:
+        Analytics, or None if the pipeline has no runs
+    """
+    # Run-level aggregates in one row
+    run_stats_query = select(
+        func.count().label("total_runs"),
+        func.count().filter(models.Run.status == models.RunStatus.SUCCESS).label("success_count"),
+        func.count().filter(models.Run.status == models.RunStatus.FAILURE).label("failure_count"),
+        # avg() skips runs without an end_time (still running)
+        func.avg(
+            func.extract("epoch", models.Run.end_time - models.Run.start_time) * 1000
+        ).cast(Float).label("avg_duration_ms"),
+    ).where(models.Run.pipeline_name == pipeline_name)
+
+    # Step counts by type - read from the rollup maintained on ingest (no steps scan)
+    step_types_query = (
+        select(models.PipelineStepTypeCount.step_type, models.PipelineStepTypeCount.count)
+        .where(models.PipelineStepTypeCount.pipeline_name == pipeline_name)
+    )
+
+    (run_stats,), step_type_rows = await asyncio.gather(
+        _fetch_all(run_stats_query),
+        _fetch_all(step_types_query),
+    )
+
+    if not run_stats.total_runs:
+        return None
+
+    total_runs = run_stats.total_runs
+    success_count = run_stats.success_count
+    failure_count = run_stats.failure_count
+    success_rate = success_count / total_runs if total_runs > 0 else 0
+    avg_duration_ms = run_stats.avg_duration_ms
+
+    steps_by_type = {row.step_type.value: row.count for row in step_type_rows}
+    total_steps = sum(steps_by_type.values())
+
+    return AnalyticsResponse(
+        pipeline_name=pipeline_name,
+        total_runs=total_runs,
+        success_count=success_count,
+        failure_count=failure_count,
+        success_rate=success_rate,
+        avg_duration_ms=avg_duration_ms,
+        total_steps=total_steps,
+        steps_by_type=steps_by_type,
+    )
+
+
 @router.get("/analytics/pipeline/{pipeline_name}", response_model=AnalyticsResponse)
-async def get_pipeline_analytics(pipeline_name: str, db: Session = Depends(get_db)):
+async def get_pipeline_analytics(pipeline_name: str, db: AsyncSession = Depends(get_db)):
     """
     Get analytics/statistics for a specific pipeline.
 
@@ -259,6 +859,12 @@ async def get_pipeline_analytics(pipeline_name: str, db: Session = Depends(get_d
     - Average duration
     - Step-level statistics
 
+    Served from the mv_pipeline_analytics materialized view with a single
+    indexed lookup, so figures may lag ingest by up to
+    ANALYTICS_REFRESH_SECONDS. Pipelines not in the view yet are computed live.
+    Responses are cached in-process for ANALYTICS_CACHE_TTL_SECONDS; live ones
+    only until the next ingest for the pipeline.
+
     Args:
         pipeline_name: Name of the pipeline
         db: Database session
@@ -269,49 +875,33 @@ async def get_pipeline_analytics(pipeline_name: str, db: Session = Depends(get_d
     Example:
         GET /api/analytics/pipeline/competitor_selection
     """
-    # Query runs for this pipeline
-    runs = db.query(models.Run).filter(models.Run.pipeline_name == pipeline_name).all()
+    cached = _analytics_cache.get(pipeline_name)
+    if cached is not None:
+        return cached[0]
+
+    view = models.pipeline_analytics_view
+    result = await db.execute(select(view).where(view.c.pipeline_name == pipeline_name))
+    row = result.one_or_none()
+
+    if row is not None:
+        analytics = AnalyticsResponse(
+            pipeline_name=row.pipeline_name,
+            total_runs=row.total_runs,
+            success_count=row.success_count,
+            failure_count=row.failure_count,
+            success_rate=row.success_count / row.total_runs if row.total_runs > 0 else 0,
+            avg_duration_ms=row.avg_duration_ms,
+            total_steps=row.total_steps,
+            steps_by_type=row.steps_by_type,
+        )
+    else:
+        analytics = await _compute_pipeline_analytics(pipeline_name)
 
-    if not runs:
+    if analytics is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No runs found for pipeline: {pipeline_name}"
         )
 
-    # Calculate statistics
-    total_runs = len(runs)
-    success_count = sum(1 for r in runs if r.status == models.RunStatus.SUCCESS)
-    failure_count = sum(1 for r in runs if r.status == models.RunStatus.FAILURE)
-    success_rate = success_count / total_runs if total_runs > 0 else 0
-
-    # Calculate average duration (only for completed runs)
-    durations = []
-    for run in runs:
-        if run.start_time and run.end_time:
-            duration_ms = (run.end_time - run.start_time).total_seconds() * 1000
-            durations.append(duration_ms)
-
-    avg_duration_ms = sum(durations) / len(durations) if durations else None
-
-    # Get step-level statistics
-    run_ids = [r.id for r in runs]
-    steps = db.query(models.Step).filter(models.Step.run_id.in_(run_ids)).all()
-
-    total_steps = len(steps)
-
-    # Count steps by type
-    steps_by_type = {}
-    for step in steps:
-        step_type = step.step_type.value
-        steps_by_type[step_type] = steps_by_type.get(step_type, 0) + 1
-
-    return AnalyticsResponse(
-        pipeline_name=pipeline_name,
-        total_runs=total_runs,
-        success_count=success_count,
-        failure_count=failure_count,
-        success_rate=success_rate,
-        avg_duration_ms=avg_duration_ms,
-        total_steps=total_steps,
-        steps_by_type=steps_by_type,
-    )
+    _analytics_cache[pipeline_name] = (analytics, row is None)
+    return analytics
@@ -7,7 +7,7 @@ They match the SDK models but are used for API validation and serialization.
 Reference: IMPLEMENTATION_PLAN.md -> "API Schemas"
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from uuid import UUID
@@ -48,6 +48,12 @@ class StepSchema(BaseModel):
     Step schema - matches SDK StepModel.
 
     Used for both ingest (request) and query (response).
+    The heavy fields (inputs, outputs, candidates_data) are omitted from
+    run detail responses unless requested via ?include=...
+
+    The JSON payload fields are SkipValidation: they are stored as JSONB
+    as-is, so Pydantic doesn't walk (possibly large, nested) candidate
+    lists just to re-check that they are dicts.
     """
     id: UUID
     run_id: Optional[UUID] = None
@@ -58,22 +64,53 @@ class StepSchema(BaseModel):
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
 
-    inputs: Dict[str, Any] = Field(default_factory=dict)
-    outputs: Dict[str, Any] = Field(default_factory=dict)
+    inputs: SkipValidation[Optional[Dict[str, Any]]] = Field(default_factory=dict)
+    outputs: SkipValidation[Optional[Dict[str, Any]]] = Field(default_factory=dict)
     reasoning: str = ""
 
     candidates_in: Optional[int] = None
     candidates_out: Optional[int] = None
-    candidates_data: Optional[List[Dict[str, Any]]] = None
+    candidates_data: SkipValidation[Optional[List[Dict[str, Any]]]] = None
+    reduction_rate: Optional[float] = None  # Computed by the database; ignored on ingest
 
-    filters_applied: Dict[str, Any] = Field(default_factory=dict)
-    metadata: Dict[str, Any] = Field(default_factory=dict, validation_alias="step_metadata")
+    filters_applied: SkipValidation[Optional[Dict[str, Any]]] = Field(default_factory=dict)
+    metadata: SkipValidation[Dict[str, Any]] = Field(default_factory=dict, validation_alias="step_metadata")
 
     class Config:
         from_attributes = True  # Allow converting from SQLAlchemy models
         populate_by_name = True  # Allow both 'metadata' and 'step_metadata'
 
 
+class StepSummarySchema(BaseModel):
+    """
+    Lightweight step schema for list views.
+
+    StepSchema without the potentially large JSON payloads (inputs, outputs,
+    candidates_data). Fetch the run with ?include=... for those.
+    """
+    id: UUID
+    run_id: Optional[UUID] = None
+    step_name: str
+    step_type: StepType
+    sequence: int = 0
+
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+
+    reasoning: str = ""
+
+    candidates_in: Optional[int] = None
+    candidates_out: Optional[int] = None
+    reduction_rate: Optional[float] = None
+
+    filters_applied: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = Field(default_factory=dict, validation_alias="step_metadata")
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+
+
 class RunSchema(BaseModel):
     """
     Run schema - matches SDK RunModel.
@@ -97,6 +134,23 @@ class RunSchema(BaseModel):
         populate_by_name = True  # Allow both 'metadata' and 'run_metadata'
 
 
+class RunSummarySchema(BaseModel):
+    """
+    Lightweight run schema for list views.
+
+    Leaves out the JSONB columns (metadata, final_output) so listing runs
+    never reads or serializes them. Fetch a run by ID for the full record.
+    """
+    id: UUID
+    pipeline_name: str
+    pipeline_version: str = "1.0.0"
+
+    start_time: datetime
+    end_time: Optional[datetime] = None
+
+    status: RunStatus = RunStatus.RUNNING
+
+
 class IngestPayload(BaseModel):
     """
     Ingest payload - what the SDK sends to the API.
@@ -119,6 +173,19 @@ class IngestResponse(BaseModel):
     steps_count: int
 
 
+class BatchIngestResponse(BaseModel):
+    """
+    Response from batch ingest endpoint.
+
+    Confirms receipt of every run in the batch.
+    """
+    success: bool
+    run_ids: List[UUID]
+    message: str = "Traces ingested successfully"
+    runs_count: int
+    steps_count: int
+
+
 class RunDetailResponse(BaseModel):
     """
     Detailed run response - includes all steps.
@@ -135,7 +202,7 @@ class RunListResponse(BaseModel):
 
     Used for listing/searching runs.
     """
-    runs: List[RunSchema]
+    runs: List[RunSummarySchema]
     total: int
     page: int
     page_size: int
@@ -162,6 +229,7 @@ class StepQueryFilter(BaseModel):
     This enables cross-pipeline queries like:
     - "Show me all LLM steps"
     - "Show me all FILTER steps that eliminated >90% candidates"
+    - "Show me all steps run with category_similarity_threshold = 0.3"
     """
     step_type: Optional[StepType] = None
     step_name: Optional[str] = None
@@ -181,17 +249,57 @@ class StepQueryFilter(BaseModel):
     start_time_from: Optional[datetime] = None
     start_time_to: Optional[datetime] = None
 
+    # JSONB containment (e.g., {"category_similarity_threshold": 0.3})
+    filters_applied: Optional[Dict[str, Any]] = None
+
 
 class StepListResponse(BaseModel):
     """
-    Paginated list of steps.
+    Keyset-paginated list of steps.
+
+    Used for cross-pipeline step queries. There is no total count -
+    has_more tells whether another page exists; next_cursor is an opaque
+    token for it (None on the last page). Use /steps/estimate_count for an
+    approximate total.
 
-    Used for cross-pipeline step queries.
+    total and page are only set for the deprecated ?offset= pagination.
     """
-    steps: List[StepSchema]
-    total: int
-    page: int
+    steps: List[StepSummarySchema]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
     page_size: int
+    total: Optional[int] = None
+    page: Optional[int] = None
+
+
+class StepCountEstimate(BaseModel):
+    """Planner estimate of how many steps match a query (not an exact count)"""
+    estimated_count: int
+
+
+class StepStatsBucket(BaseModel):
+    """
+    One histogram bucket of step statistics.
+
+    Steps are grouped by the value of a single filters_applied key.
+    """
+    value: Optional[str] = None  # filters_applied->>key (None if the key is absent)
+    count: int
+    avg_reduction_rate: Optional[float] = None
+
+
+class StepStatsResponse(BaseModel):
+    """
+    Aggregated statistics for one step across runs.
+
+    Computed entirely in SQL - only the histogram is returned, not the rows.
+    """
+    step_name: str
+    pipeline_name: Optional[str] = None
+    filter_key: Optional[str] = None
+    total_steps: int
+    avg_reduction_rate: Optional[float] = None
+    buckets: List[StepStatsBucket] = Field(default_factory=list)
 
 
 class AnalyticsResponse(BaseModel):
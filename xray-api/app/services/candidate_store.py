@@ -0,0 +1,194 @@
+"""
+X-Ray API Candidate Store
+
+Keeps sampled candidate data (StepModel.candidates_data) out of Postgres.
+
+Candidate samples can be MBs per step. Storing them inline bloats the steps
+table and slows every query that touches it, so they are written to object
+storage as gzip-compressed JSON and only the URI is kept in
+steps.candidates_data_uri. They are fetched only when a client asks for them.
+Rows ingested before the store existed keep their samples inline in
+steps.candidates_data; the query router falls back to that column.
+
+Backends (chosen by CANDIDATES_STORE_URI):
+- file:./.xray/candidates          -> directory relative to the working dir (default)
+- file:///var/lib/xray/candidates  -> absolute local (or mounted) directory
+- s3://bucket/prefix               -> S3 / MinIO (requires boto3)
+"""
+
+import asyncio
+import gzip
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+from uuid import UUID
+
+import orjson
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+Candidates = List[Dict[str, Any]]
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+
+class CandidateStore(ABC):
+    """
+    Base class for candidate blob storage.
+
+    Subclasses implement _write and _read for raw bytes; this class handles
+    the (de)serialization and async fan-out.
+    """
+
+    def __init__(self, base_uri: str):
+        self.base_uri = base_uri.rstrip("/")
+
+    @abstractmethod
+    def _write(self, key: str, data: bytes) -> str:
+        """Store data under key, return its URI"""
+
+    @abstractmethod
+    def _read(self, uri: str) -> bytes:
+        """Return the bytes stored at uri"""
+
+    def put(self, step_id: UUID, candidates: Candidates) -> str:
+        """
+        Store one step's candidates.
+
+        Args:
+            step_id: Step the candidates belong to (used as the object key)
+            candidates: Sampled candidate data
+
+        Returns:
+            URI of the stored blob
+        """
+        data = gzip.compress(orjson.dumps(candidates), compresslevel=5)
+        return self._write(f"{step_id}.json.gz", data)
+
+    def get(self, uri: str) -> Optional[Candidates]:
+        """
+        Load one step's candidates.
+
+        Returns None (and logs) if the blob is missing, so one lost object
+        doesn't fail the whole run response.
+        """
+        try:
+            return orjson.loads(gzip.decompress(self._read(uri)))
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to load candidates from {uri}: {e}")
+            return None
+
+    async def put_many(self, items: Sequence[Tuple[UUID, Candidates]]) -> List[str]:
+        """Store several steps' candidates concurrently (blocking I/O runs in threads)"""
+        return await asyncio.gather(*(
+            asyncio.to_thread(self.put, step_id, candidates)
+            for step_id, candidates in items
+        ))
+
+    async def get_many(self, uris: Sequence[Optional[str]]) -> List[Optional[Candidates]]:
+        """Load several steps' candidates concurrently; None URIs map to None"""
+
+        async def _get(uri: Optional[str]) -> Optional[Candidates]:
+            if not uri:
+                return None
+            return await asyncio.to_thread(self.get, uri)
+
+        return await asyncio.gather(*(_get(uri) for uri in uris))
+
+
+class FileCandidateStore(CandidateStore):
+    """Stores blobs as files in a local (or mounted) directory"""
+
+    def __init__(self, base_uri: str):
+        super().__init__(base_uri)
+        # Relative paths (file:./dir) are resolved against the working directory
+        # once, so the URIs stored in steps.candidates_data_uri stay absolute
+        self.root = Path(urlparse(self.base_uri).path).absolute()
+
+    def _write(self, key: str, data: bytes) -> str:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / key
+        path.write_bytes(data)
+        return path.as_uri()
+
+    def _read(self, uri: str) -> bytes:
+        return Path(urlparse(uri).path).read_bytes()
+
+
+class S3CandidateStore(CandidateStore):
+    """Stores blobs in an S3-compatible bucket (AWS S3, MinIO)"""
+
+    def __init__(self, base_uri: str):
+        super().__init__(base_uri)
+
+        try:
+            import boto3
+        except ImportError as e:
+            raise ImportError(
+                "boto3 is required for s3:// candidate storage. Install it with: pip install boto3"
+            ) from e
+
+        parsed = urlparse(self.base_uri)
+        self.bucket = parsed.netloc
+        self.prefix = parsed.path.strip("/")
+        # boto3 clients are thread-safe, so one client serves all to_thread workers
+        self.client = boto3.client("s3", endpoint_url=settings.candidates_s3_endpoint_url)
+
+    def _write(self, key: str, data: bytes) -> str:
+        object_key = f"{self.prefix}/{key}" if self.prefix else key
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=object_key,
+            Body=data,
+            ContentType="application/json",
+            ContentEncoding="gzip",
+        )
+        return f"s3://{self.bucket}/{object_key}"
+
+    def _read(self, uri: str) -> bytes:
+        parsed = urlparse(uri)
+        response = self.client.get_object(Bucket=parsed.netloc, Key=parsed.path.lstrip("/"))
+        return response["Body"].read()
+
+
+# =============================================================================
+# FACTORY
+# =============================================================================
+
+
+_BACKENDS = {
+    "file": FileCandidateStore,
+    "s3": S3CandidateStore,
+}
+
+_store: Optional[CandidateStore] = None
+
+
+def get_candidate_store() -> CandidateStore:
+    """
+    Get the configured candidate store (created on first use).
+
+    Returns:
+        CandidateStore for settings.candidates_store_uri
+
+    Raises:
+        ValueError: If the URI scheme is not supported
+    """
+    global _store
+    if _store is None:
+        scheme = urlparse(settings.candidates_store_uri).scheme
+        backend = _BACKENDS.get(scheme)
+        if backend is None:
+            raise ValueError(
+                f"Unsupported CANDIDATES_STORE_URI scheme: {scheme!r}. "
+                f"Supported: {', '.join(_BACKENDS)}"
+            )
+        _store = backend(settings.candidates_store_uri)
+    return _store
@@ -0,0 +1,32 @@
+"""Tests for which cached pipeline analytics an ingest invalidates."""
+
+import pytest
+
+from app.routers import query
+
+
+@pytest.fixture(autouse=True)
+def clear_analytics_cache():
+    query._analytics_cache.clear()
+    yield
+    query._analytics_cache.clear()
+
+
+def test_ingest_drops_live_computed_analytics():
+    query._analytics_cache["new_pipeline"] = ("analytics", True)
+
+    query.invalidate_pipeline_analytics("new_pipeline")
+
+    assert "new_pipeline" not in query._analytics_cache
+
+
+def test_ingest_keeps_view_served_analytics():
+    query._analytics_cache["known_pipeline"] = ("analytics", False)
+
+    query.invalidate_pipeline_analytics("known_pipeline")
+
+    assert query._analytics_cache["known_pipeline"] == ("analytics", False)
+
+
+def test_invalidating_uncached_pipeline_is_a_no_op():
+    query.invalidate_pipeline_analytics("missing")
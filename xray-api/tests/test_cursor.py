@@ -0,0 +1,67 @@
+"""Tests for the signed step query cursors."""
+
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.config import settings
+from app.main import app, lifespan
+from app.routers import query
+
+
+def test_cursor_round_trip():
+    start_time, step_id = datetime(2026, 1, 12, 8, 30, 15, 123456), uuid4()
+
+    assert query._decode_cursor(query._encode_cursor(start_time, step_id)) == (start_time, step_id)
+
+
+@pytest.mark.parametrize("tamper", [
+    lambda payload, signature: (query._b64encode(query._b64decode(payload).replace(b"2026", b"2025")), signature),
+    lambda payload, signature: (payload, signature[:-2] + ("AA" if signature[-2:] != "AA" else "BB")),
+    lambda payload, signature: (payload, ""),
+])
+def test_tampered_cursor_is_rejected(tamper):
+    payload, signature = query._encode_cursor(datetime(2026, 1, 12), uuid4()).split(".")
+
+    with pytest.raises(HTTPException) as error:
+        query._decode_cursor(".".join(tamper(payload, signature)))
+    assert error.value.status_code == 400
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "a.b.c", "%%%.%%%"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as error:
+        query._decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+def test_cursor_from_another_key_is_rejected(monkeypatch):
+    # e.g. issued by another worker, or before a restart, without CURSOR_SECRET
+    cursor = query._encode_cursor(datetime(2026, 1, 12), uuid4())
+    monkeypatch.setattr(query, "_CURSOR_KEY", b"another-key")
+
+    with pytest.raises(HTTPException) as error:
+        query._decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+def test_expired_cursor_is_rejected(monkeypatch):
+    cursor = query._encode_cursor(datetime(2026, 1, 12), uuid4())
+    issued = query.time.time()
+    monkeypatch.setattr(query.time, "time", lambda: issued + settings.cursor_ttl_seconds + 1)
+
+    with pytest.raises(HTTPException) as error:
+        query._decode_cursor(cursor)
+    assert error.value.status_code == 400
+    assert "Expired" in error.value.detail
+
+
+def test_startup_requires_cursor_secret_with_several_workers(monkeypatch):
+    monkeypatch.setattr(settings, "cursor_secret", "")
+    monkeypatch.setattr(settings, "web_concurrency", 2)
+
+    with pytest.raises(RuntimeError, match="CURSOR_SECRET"):
+        asyncio.run(lifespan(app).__aenter__())
@@ -0,0 +1,40 @@
+"""Tests for which runs of an ingest batch get written."""
+
+import asyncio
+import uuid
+from datetime import datetime
+
+from app.routers import ingest
+from app.schemas import IngestPayload, RunSchema, StepSchema
+
+
+class RecordingSession:
+    """Stands in for the AsyncSession; every run id is reported as already stored."""
+
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, statement, rows):
+        self.executed.append(rows)
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+def make_payload(run_id: uuid.UUID) -> IngestPayload:
+    run = RunSchema(id=run_id, pipeline_name="test_pipeline", start_time=datetime(2026, 1, 1))
+    step = StepSchema(id=uuid.uuid4(), run_id=run_id, step_name="filter", step_type="filter")
+    return IngestPayload(run=run, steps=[step])
+
+
+def test_repeated_run_id_in_a_batch_is_inserted_once():
+    repeated, other = uuid.uuid4(), uuid.uuid4()
+    db = RecordingSession()
+
+    asyncio.run(ingest._persist_payloads(db, [make_payload(repeated), make_payload(other), make_payload(repeated)]))
+
+    assert [row["id"] for row in db.executed[0]] == [repeated, other]
@@ -0,0 +1,39 @@
+"""Tests for the finished-run response cache of GET /api/runs/{run_id}."""
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import get_db
+from app.main import app
+from app.routers import query
+
+
+@pytest.fixture
+def client():
+    async def no_db():
+        yield None  # Cache hits never touch the database
+
+    app.dependency_overrides[get_db] = no_db
+    query._run_cache.clear()
+    yield TestClient(app)
+    query._run_cache.clear()
+    app.dependency_overrides.pop(get_db)
+
+
+def test_run_id_spellings_share_one_cache_entry(client):
+    run_id = uuid4()
+    query._run_cache[(run_id, ())] = ('"cached-etag"', b'{"run": {}, "steps": []}')
+
+    for spelling in (str(run_id), str(run_id).upper(), run_id.hex):
+        response = client.get(f"/api/runs/{spelling}")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"cached-etag"'
+
+    assert len(query._run_cache) == 1
+
+
+def test_invalid_run_id_is_rejected(client):
+    assert client.get("/api/runs/not-a-uuid").status_code == 422
@@ -0,0 +1,67 @@
+"""
+Shared fixtures for the X-Ray SDK tests.
+
+No test talks to a real API: `mock_api` routes the shared connection pool
+through an httpx.MockTransport.
+"""
+
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from xray import client as client_module
+from xray.client import XRayClient
+from xray.config import reset_config
+from xray.models import IngestPayload, RunModel, StepModel, StepType
+
+
+@pytest.fixture(autouse=True)
+def reset_xray():
+    """Give every test a fresh configuration, breakers and client."""
+    reset_config()
+    XRayClient._breakers.clear()
+    XRayClient.dropped_count = 0
+    client_module._client = None
+    yield
+    XRayClient.flush(timeout=5)
+    reset_config()
+    XRayClient._breakers.clear()
+    client_module._client = None
+    if XRayClient._pool is not None:
+        XRayClient._pool.close()
+        XRayClient._pool = None
+
+
+@pytest.fixture
+def mock_api() -> Callable[[Callable[[httpx.Request], httpx.Response]], List[httpx.Request]]:
+    """
+    Install a request handler in place of the API.
+
+    Returns a function taking the handler; it returns the list that every
+    request sent to the API is appended to.
+    """
+
+    def install(handler: Callable[[httpx.Request], httpx.Response]) -> List[httpx.Request]:
+        requests: List[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        XRayClient._pool = httpx.Client(transport=httpx.MockTransport(record))
+        return requests
+
+    return install
+
+
+def make_payload(pipeline_name: str = "test_pipeline", steps: int = 1) -> IngestPayload:
+    """Build a small valid payload."""
+    run = RunModel(pipeline_name=pipeline_name)
+    return IngestPayload(
+        run=run,
+        steps=[
+            StepModel(run_id=run.id, step_name=f"step_{i}", step_type=StepType.FILTER, sequence=i)
+            for i in range(steps)
+        ],
+    )
@@ -0,0 +1,117 @@
+"""Tests for batch sends and the send_async workers that coalesce traces into batches."""
+
+import httpx
+import orjson
+import pytest
+
+from xray import configure
+from xray.client import XRayClient
+
+from .conftest import make_payload
+
+
+def batch_fails_with(status_code: int):
+    """Handler rejecting every batch request; single-trace requests succeed except for pipeline 'bad'"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(":batch"):
+            return httpx.Response(status_code)
+        if orjson.loads(request.content)["run"]["pipeline_name"] == "bad":
+            return httpx.Response(422)
+        return httpx.Response(201)
+
+    return handler
+
+
+def test_batch_is_one_request(mock_api):
+    configure(api_url="http://xray.test", max_retries=0)
+    requests = mock_api(lambda request: httpx.Response(201))
+
+    assert XRayClient().send_batch([make_payload(), make_payload(), make_payload()])
+    assert [request.url.path for request in requests] == ["/api/runs/ingest:batch"]
+    assert len(orjson.loads(requests[0].content)) == 3
+
+
+def test_rejected_batch_is_split(mock_api):
+    configure(api_url="http://xray.test", max_retries=0)
+    requests = mock_api(batch_fails_with(422))
+
+    results = XRayClient()._send_batch([make_payload(), make_payload("bad"), make_payload()])
+
+    assert [bool(result) for result in results] == [True, False, True]
+    assert [request.url.path for request in requests] == ["/api/runs/ingest:batch"] + ["/api/runs/ingest"] * 3
+
+
+def test_batch_conflict_is_split_not_delivered(mock_api):
+    configure(api_url="http://xray.test", max_retries=0)
+    requests = mock_api(batch_fails_with(409))
+
+    assert XRayClient().send_batch([make_payload(), make_payload()])
+    assert len(requests) == 3
+
+
+def test_server_error_batch_is_split(mock_api):
+    configure(api_url="http://xray.test", max_retries=0)
+    requests = mock_api(batch_fails_with(500))
+
+    results = XRayClient()._send_batch([make_payload(), make_payload("bad")])
+
+    assert [bool(result) for result in results] == [True, False]
+    assert len(requests) == 3
+
+
+def test_unreachable_api_is_not_split(mock_api):
+    configure(api_url="http://xray.test", max_retries=0)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    requests = mock_api(handler)
+
+    assert not XRayClient().send_batch([make_payload(), make_payload()])
+    assert len(requests) == 1
+
+
+def test_send_async_future_is_per_trace_result(mock_api):
+    configure(api_url="http://xray.test", max_retries=0)
+    mock_api(batch_fails_with(422))
+    client = XRayClient()
+
+    good = client.send_async(make_payload())
+    bad = client.send_async(make_payload("bad"))
+
+    assert good.result(timeout=5)
+    assert not bad.result(timeout=5)
+
+
+def test_send_async_uses_enqueuing_client_config(mock_api):
+    configure(api_url="http://first.test", max_retries=0)
+    requests = mock_api(lambda request: httpx.Response(201))
+    client = XRayClient()
+
+    configure(api_url="http://second.test", max_retries=0)
+    assert client.send_async(make_payload()).result(timeout=5)
+
+    assert [request.url.host for request in requests] == ["first.test"]
+
+
+def test_raise_mode_still_sends_traces_after_a_failure(mock_api):
+    configure(api_url="http://xray.test", max_retries=0, fallback_mode="raise")
+    requests = mock_api(batch_fails_with(422))
+
+    with pytest.raises(Exception):
+        XRayClient().send_batch([make_payload("bad"), make_payload(), make_payload()])
+
+    assert len(requests) == 4  # The batch, then every trace on its own
+
+
+def test_raise_mode_fails_only_the_failed_traces_future(mock_api):
+    configure(api_url="http://xray.test", max_retries=0, fallback_mode="raise")
+    mock_api(batch_fails_with(422))
+    client = XRayClient()
+
+    bad = client.send_async(make_payload("bad"))
+    good = client.send_async(make_payload())
+
+    assert good.result(timeout=5)
+    assert bad.exception(timeout=5) is not None
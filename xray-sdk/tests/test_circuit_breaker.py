@@ -0,0 +1,99 @@
+"""Tests for CircuitBreaker state transitions and how XRayClient reports outcomes to it."""
+
+import httpx
+
+from xray import configure
+from xray.client import CircuitBreaker, XRayClient
+
+from .conftest import make_payload
+
+
+def test_opens_after_threshold_failures():
+    breaker = CircuitBreaker(failure_threshold=3, window_seconds=30, cooldown_seconds=30)
+
+    for _ in range(2):
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, window_seconds=30, cooldown_seconds=30)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_lets_exactly_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, window_seconds=30, cooldown_seconds=0)
+    breaker.record_failure()
+
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+
+def test_half_open_probe_success_closes():
+    breaker = CircuitBreaker(failure_threshold=1, window_seconds=30, cooldown_seconds=0)
+    breaker.record_failure()
+    breaker.allow_request()
+
+    breaker.record_success()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, window_seconds=30, cooldown_seconds=30)
+    breaker.record_failure()
+    breaker.cooldown_seconds = 0
+    breaker.allow_request()
+    breaker.cooldown_seconds = 30
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_unexpected_probe_error_does_not_wedge_breaker(mock_api):
+    configure(
+        api_url="http://xray.test",
+        max_retries=0,
+        breaker_failure_threshold=1,
+        breaker_cooldown_seconds=0,
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("not an httpx error")
+
+    requests = mock_api(handler)
+    client = XRayClient()
+    client._breaker.record_failure()  # Open; cooldown 0 -> next send is the probe
+
+    assert not client.send(make_payload())
+    assert client._breaker.state == CircuitBreaker.OPEN
+
+    # The breaker still hands out probes afterwards
+    assert not client.send(make_payload())
+    assert len(requests) == 2
+
+
+def test_open_breaker_skips_request(mock_api):
+    configure(api_url="http://xray.test", max_retries=0, breaker_failure_threshold=1)
+    requests = mock_api(lambda request: httpx.Response(503))
+    client = XRayClient()
+
+    assert not client.send(make_payload())
+    assert client._breaker.state == CircuitBreaker.OPEN
+
+    assert not client.send(make_payload())
+    assert len(requests) == 1
@@ -0,0 +1,27 @@
+"""Tests for reading the SDK configuration from the environment."""
+
+from xray.config import FallbackMode, XRayConfig, configure, get_config, reset_config
+
+
+def test_from_env_reads_only_the_given_mapping(monkeypatch):
+    monkeypatch.setenv("XRAY_MAX_RETRIES", "7")
+    monkeypatch.setenv("XRAY_API_URL", "http://from-environ.test")
+
+    config = XRayConfig.from_env({"XRAY_FALLBACK_MODE": "RAISE"})
+
+    assert config.fallback_mode is FallbackMode.RAISE
+    assert config.max_retries == 2
+    assert config.api_url == "http://localhost:8000"
+
+
+def test_configure_on_unset_config_starts_from_environment(monkeypatch):
+    monkeypatch.setenv("XRAY_API_URL", "http://from-environ.test")
+    monkeypatch.setenv("XRAY_MAX_RETRIES", "7")
+
+    from_get_config = get_config().model_copy()
+    reset_config()
+    configured = configure(max_retries=1)
+
+    assert from_get_config.api_url == configured.api_url == "http://from-environ.test"
+    assert from_get_config.max_retries == 7
+    assert configured.max_retries == 1
@@ -0,0 +1,23 @@
+"""Tests for RunContext/StepContext when tracing is disabled."""
+
+from xray import RunContext, configure, get_current_run
+from xray.models import RunModel, StepModel, StepType
+
+
+def test_disabled_contexts_expose_inert_models(mock_api):
+    configure(enabled=False)
+    requests = mock_api(lambda request: None)
+
+    with RunContext("pipeline") as run:
+        assert isinstance(run.run_model, RunModel)
+        run.run_model.metadata["user_id"] = 1  # Accepted, then discarded
+
+        with run.step("filter", StepType.FILTER) as step:
+            assert isinstance(step.step_model, StepModel)
+            step.step_model.metadata["note"] = "x"
+            step.set_candidates(10, 5)
+
+        assert run.run_model.metadata == {}
+        assert get_current_run() is None
+
+    assert requests == []
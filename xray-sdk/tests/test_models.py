@@ -0,0 +1,17 @@
+"""Tests for the SDK data models."""
+
+from xray.models import StepModel, StepType
+
+
+def test_reduction_rate_follows_candidate_counts():
+    step = StepModel(step_name="filter", step_type=StepType.FILTER, candidates_in=100, candidates_out=10)
+    assert step.reduction_rate == 0.9
+
+    step.candidates_out = 50  # Assigned directly, not through set_candidates
+    assert step.reduction_rate == 0.5
+
+    step.set_candidates(0, 0)
+    assert step.reduction_rate is None
+
+    step.set_candidates(200, 50)
+    assert step.model_dump()["reduction_rate"] == 0.75
@@ -0,0 +1,94 @@
+"""Tests for the connection pool shared by every XRayClient."""
+
+import asyncio
+import threading
+
+import httpx
+
+from xray import configure
+from xray.client import XRayClient
+
+from .conftest import make_payload
+
+
+def test_pool_is_created_lazily_and_shared():
+    assert XRayClient._pool is None
+    first, second = XRayClient(), XRayClient()
+    assert XRayClient._pool is None  # Creating clients opens nothing
+
+    pool = first._get_pool()
+
+    assert isinstance(pool, httpx.Client)
+    assert second._get_pool() is pool
+
+
+def test_sends_from_different_clients_use_the_shared_pool(mock_api):
+    configure(api_url="http://xray.test", max_retries=0)
+    requests = mock_api(lambda request: httpx.Response(201))
+    pool = XRayClient._pool
+
+    assert XRayClient().send(make_payload())
+    assert XRayClient().send(make_payload())
+
+    assert XRayClient._pool is pool
+    assert len(requests) == 2
+
+
+def test_shutdown_closes_the_pool():
+    pool = XRayClient._get_pool()
+
+    XRayClient._shutdown()
+
+    assert pool.is_closed
+    assert XRayClient._pool is None
+
+
+def test_aclose_pools_closes_the_loops_async_pool():
+    async def open_then_close() -> httpx.AsyncClient:
+        pool = XRayClient._get_async_pool()
+        await XRayClient.aclose_pools()
+        return pool
+
+    pool = asyncio.run(open_then_close())
+
+    assert pool.is_closed
+    assert len(XRayClient._async_pools) == 0
+
+
+def test_asend_log_fallback_writes_off_the_event_loop(monkeypatch, tmp_path):
+    configure(api_url="http://xray.test", max_retries=0, fallback_mode="log", fallback_log_path=str(tmp_path))
+    loop_threads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    async def send():
+        loop_threads.append(threading.get_ident())
+        XRayClient._async_pools[asyncio.get_running_loop()] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await XRayClient().asend(make_payload())
+        finally:
+            await XRayClient.aclose_pools()
+
+    write_threads = []
+    write_to_log = XRayClient._write_to_log
+
+    def recording_write(self, *args, **kwargs):
+        write_threads.append(threading.get_ident())
+        return write_to_log(self, *args, **kwargs)
+
+    monkeypatch.setattr(XRayClient, "_write_to_log", recording_write)
+    result = asyncio.run(send())
+
+    assert result and result.log_path.exists()
+    assert write_threads and write_threads[0] != loop_threads[0]
+
+
+def test_shutdown_keeps_the_pool_while_workers_are_busy(monkeypatch):
+    pool = XRayClient._get_pool()
+    monkeypatch.setattr(XRayClient, "flush", classmethod(lambda cls, timeout=None: False))
+
+    XRayClient._shutdown()
+
+    assert not pool.is_closed
+    assert XRayClient._pool is pool
@@ -0,0 +1,114 @@
+"""Tests for XRayClient retries, backoff delays and which responses count as delivered."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from xray import configure
+from xray import client as client_module
+from xray.client import XRayClient
+
+from .conftest import make_payload
+
+
+def responses(*status_codes: int):
+    """Handler answering with the given status codes in order (the last one repeats)"""
+    remaining = list(status_codes)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(remaining.pop(0) if len(remaining) > 1 else remaining[0])
+
+    return handler
+
+
+def test_5xx_is_retried_until_success(mock_api):
+    configure(api_url="http://xray.test", max_retries=3, retry_base_delay=0)
+    requests = mock_api(responses(503, 502, 201))
+
+    assert XRayClient().send(make_payload())
+    assert len(requests) == 3
+
+
+def test_gives_up_after_max_retries(mock_api):
+    configure(api_url="http://xray.test", max_retries=2, retry_base_delay=0)
+    requests = mock_api(responses(500))
+
+    assert not XRayClient().send(make_payload())
+    assert len(requests) == 3
+
+
+def test_timeout_is_retried(mock_api):
+    configure(api_url="http://xray.test", max_retries=1, retry_base_delay=0)
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(201)
+
+    mock_api(handler)
+
+    assert XRayClient().send(make_payload())
+    assert len(attempts) == 2
+
+
+def test_4xx_is_not_retried(mock_api):
+    configure(api_url="http://xray.test", max_retries=3, retry_base_delay=0)
+    requests = mock_api(responses(422))
+
+    assert not XRayClient().send(make_payload())
+    assert len(requests) == 1
+
+
+def test_409_counts_as_delivered(mock_api):
+    configure(api_url="http://xray.test", max_retries=3, retry_base_delay=0)
+    requests = mock_api(responses(409))
+
+    assert XRayClient().send(make_payload())
+    assert len(requests) == 1
+
+
+def test_asend_follows_the_same_rules():
+    configure(api_url="http://xray.test", max_retries=3, retry_base_delay=0)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(503 if len(requests) == 1 else 409)
+
+    async def send() -> bool:
+        pool = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        XRayClient._async_pools[asyncio.get_running_loop()] = pool
+        async with pool:
+            return bool(await XRayClient().asend(make_payload()))
+
+    assert asyncio.run(send())
+    assert len(requests) == 2
+
+
+def test_retry_delay_doubles_per_attempt(monkeypatch):
+    configure(retry_base_delay=0.5, retry_max_delay=30, retry_jitter=0.5)
+    monkeypatch.setattr(client_module.random, "random", lambda: 0.0)
+    client = XRayClient()
+
+    assert [client._retry_delay(attempt) for attempt in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 4.0]
+
+
+def test_retry_delay_jitter_stays_within_bounds():
+    configure(retry_base_delay=1.0, retry_max_delay=30, retry_jitter=0.5)
+    client = XRayClient()
+
+    delays = [client._retry_delay(2) for _ in range(200)]
+
+    assert all(2.0 <= delay <= 3.0 for delay in delays)
+    assert len(set(delays)) > 1  # Clients retrying together spread out
+
+
+@pytest.mark.parametrize("attempt", [6, 10])
+def test_retry_delay_is_capped(monkeypatch, attempt):
+    configure(retry_base_delay=1.0, retry_max_delay=5.0, retry_jitter=0.5)
+    monkeypatch.setattr(client_module.random, "random", lambda: 1.0)
+
+    assert XRayClient()._retry_delay(attempt) == 5.0
@@ -0,0 +1,53 @@
+"""Tests for reservoir sampling (Algorithm L) behind sample_candidates_random."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from xray.sampling import sample_candidates_random
+
+POPULATION = 20
+SAMPLE_SIZE = 5
+TRIALS = 20_000
+
+
+@pytest.fixture
+def seeded_random():
+    state = random.getstate()
+    random.seed(1234)
+    yield
+    random.setstate(state)
+
+
+@pytest.mark.parametrize("make_input", [list, iter], ids=["list", "iterator"])
+def test_sample_has_distinct_items_of_requested_size(make_input):
+    candidates = [{"id": i} for i in range(POPULATION)]
+
+    sample = sample_candidates_random(make_input(candidates), SAMPLE_SIZE)
+
+    assert len(sample) == SAMPLE_SIZE
+    assert len({item["id"] for item in sample}) == SAMPLE_SIZE
+
+
+@pytest.mark.parametrize("make_input", [list, iter], ids=["list", "iterator"])
+def test_every_item_is_equally_likely(seeded_random, make_input):
+    candidates = [{"id": i} for i in range(POPULATION)]
+
+    counts = Counter(
+        item["id"]
+        for _ in range(TRIALS)
+        for item in sample_candidates_random(make_input(candidates), SAMPLE_SIZE)
+    )
+
+    # Each item is picked with probability k/N; allow ~4 standard deviations
+    expected = TRIALS * SAMPLE_SIZE / POPULATION
+    assert set(counts) == set(range(POPULATION))
+    assert all(abs(count - expected) < 0.05 * expected for count in counts.values())
+
+
+def test_small_input_is_returned_whole():
+    candidates = [{"id": i} for i in range(3)]
+
+    assert sample_candidates_random(candidates, SAMPLE_SIZE) == candidates
+    assert sample_candidates_random(iter(candidates), SAMPLE_SIZE) == candidates
@@ -0,0 +1,67 @@
+"""Tests for the bounded send_async queue and its worker threads."""
+
+import queue
+import threading
+
+import httpx
+import orjson
+
+from xray import configure
+from xray.client import XRayClient
+
+from .conftest import make_payload
+
+
+def test_full_queue_drops_and_counts(monkeypatch):
+    full_queue: queue.Queue = queue.Queue(maxsize=1)
+    full_queue.put_nowait(None)
+    monkeypatch.setattr(XRayClient, "_queue", full_queue)  # No workers drain it
+
+    future = XRayClient().send_async(make_payload())
+
+    assert future.done()
+    assert not future.result()
+    assert XRayClient.dropped_count == 1
+
+
+def test_queued_traces_are_coalesced_into_batches(mock_api):
+    configure(api_url="http://xray.test", max_retries=0)
+    requests = mock_api(lambda request: httpx.Response(201))
+    client = XRayClient()
+
+    futures = [client.send_async(make_payload()) for _ in range(10)]
+
+    assert XRayClient.flush(timeout=5)
+    assert all(future.done() and future.result() for future in futures)
+    assert XRayClient.dropped_count == 0
+
+    # One batch per worker at most; every trace sent exactly once
+    assert len(requests) <= 2
+    sent = [orjson.loads(request.content) for request in requests]
+    sent_runs = [
+        trace["run"]["id"]
+        for body in sent
+        for trace in (body if isinstance(body, list) else [body])
+    ]
+    assert len(sent_runs) == len(set(sent_runs)) == 10
+
+
+def test_trace_cancelled_while_queued_is_skipped(monkeypatch, mock_api):
+    configure(api_url="http://xray.test", max_retries=0)
+    requests = mock_api(lambda request: httpx.Response(201))
+    send_queue: queue.Queue = queue.Queue()
+    monkeypatch.setattr(XRayClient, "_queue", send_queue)  # Worker started by hand below
+    client = XRayClient()
+
+    cancelled = client.send_async(make_payload("cancelled"))
+    kept = client.send_async(make_payload())
+    assert cancelled.cancel()
+
+    threading.Thread(target=XRayClient._process_jobs, args=(send_queue,), daemon=True).start()
+
+    assert XRayClient.flush(timeout=5)
+    assert kept.result(timeout=5)
+    assert cancelled.cancelled()
+    assert [orjson.loads(request.content)["run"]["pipeline_name"] for request in requests] == [
+        "test_pipeline"
+    ]
@@ -51,6 +51,7 @@ from .models import (
 
 # HTTP Client (advanced usage)
 from .client import (
+    SendResult,
     XRayClient,
     send_trace,
 )
@@ -97,6 +98,7 @@ __all__ = [
     "StepType",
     # HTTP Client (advanced usage)
     "XRayClient",
+    "SendResult",
     "send_trace",
     # Sampling (advanced usage)
     "sample_candidates",
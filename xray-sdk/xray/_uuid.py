@@ -0,0 +1,84 @@
+"""
+X-Ray SDK ID Generation
+
+Time-ordered UUIDs (version 7, RFC 9562) for run and step ids.
+
+Why not uuid4:
+- uuid4 reads the OS random source once per id (one syscall per model)
+- Random ids land all over the API's primary-key B-tree indexes; v7 ids
+  start with a millisecond timestamp, so new rows append near the end
+
+Layout (128 bits):
+    48 bits  Unix timestamp in milliseconds
+     4 bits  version (7)
+    12 bits  random
+     2 bits  variant (0b10)
+    62 bits  random
+"""
+
+import os
+import threading
+import time
+from uuid import UUID
+
+
+# =============================================================================
+# RANDOMNESS BUFFER
+# =============================================================================
+
+# Random bytes fetched from the OS per refill (~400 ids)
+_RANDOM_BUFFER_SIZE = 4096
+
+# Random bytes used per id (12 + 62 bits, rounded up)
+_RANDOM_BYTES_PER_ID = 10
+
+_lock = threading.Lock()
+_buffer = b""
+_offset = 0
+
+
+def _random_bytes() -> bytes:
+    """Take the next id's random bytes from the buffer, refilling it when empty."""
+    global _buffer, _offset
+
+    with _lock:
+        if _offset + _RANDOM_BYTES_PER_ID > len(_buffer):
+            _buffer = os.urandom(_RANDOM_BUFFER_SIZE)
+            _offset = 0
+        start = _offset
+        _offset += _RANDOM_BYTES_PER_ID
+        return _buffer[start:_offset]
+
+
+# =============================================================================
+# UUID V7
+# =============================================================================
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (version 7).
+
+    Ids created in later milliseconds sort after earlier ones; within the
+    same millisecond the order is random.
+
+    Returns:
+        New UUID with version 7
+
+    Example:
+        run_id = uuid7()
+        print(run_id.version)  # 7
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    random_bits = int.from_bytes(_random_bytes(), "big")
+
+    rand_a = (random_bits >> 62) & 0xFFF
+    rand_b = random_bits & 0x3FFF_FFFF_FFFF_FFFF
+
+    return UUID(int=(
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    ))
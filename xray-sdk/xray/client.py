@@ -7,17 +7,29 @@ Implements retry logic, fallback modes, and error handling.
 Reference: IMPLEMENTATION_PLAN.md -> "Phase 1: Core SDK" -> "HTTP client with retry/fallback"
 """
 
-import json
+import asyncio
+import atexit
 import logging
+import os
+import queue
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
-import httpx
+from pydantic_core import to_json
 
-from .config import FallbackMode, get_config
+from .config import FallbackMode, XRayConfig, get_config, get_config_version
 from .models import IngestPayload
 
+if TYPE_CHECKING:
+    import httpx  # Imported on first send - see XRayClient._get_pool
+
 
 # =============================================================================
 # LOGGER SETUP
@@ -26,6 +38,137 @@ from .models import IngestPayload
 logger = logging.getLogger("xray.client")
 
 
+# =============================================================================
+# BACKGROUND SEND QUEUE
+# =============================================================================
+
+# Traces buffered for send_async before new ones are dropped
+DEFAULT_CHANNEL_CAP = 1000
+
+# Persistent background sender threads
+DEFAULT_WORKER_CNT = 2
+
+# Most traces a worker sends in one batch request
+WORKER_BATCH_PROCESSING_SIZE = 64
+
+# How long a worker waits for more traces to join a batch (seconds)
+WORKER_DEFAULT_WAIT_TIME = 0.05
+
+# How long interpreter shutdown waits for queued traces to be sent (seconds)
+SHUTDOWN_FLUSH_TIMEOUT = 5.0
+
+# Responses that mean the trace is stored. Ingest is idempotent, and 409
+# means the API already has conflicting rows - re-sending can't change that
+DELIVERED_STATUS_CODES = (200, 201, 409)
+
+
+# =============================================================================
+# SEND RESULT
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class SendResult:
+    """
+    Outcome of XRayClient.send.
+
+    Truthy when the trace was handled (sent, tracing disabled, or written
+    by the LOG fallback), so `if client.send(payload):` keeps working.
+
+    Attributes:
+        success: Same meaning as the truth value
+        log_path: File the LOG fallback wrote the trace to, if any
+    """
+
+    success: bool
+    log_path: Optional[Path] = None
+
+    def __bool__(self) -> bool:
+        return self.success
+
+
+# What one trace of a batch ended with: its SendResult, or the exception the
+# RAISE fallback raised for it
+SendOutcome = Union[SendResult, Exception]
+
+
+# =============================================================================
+# CIRCUIT BREAKER
+# =============================================================================
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the X-Ray API is known to be down.
+
+    States:
+    - CLOSED: requests go through; failures are counted
+    - OPEN: after `failure_threshold` failures within `window_seconds`,
+      requests are refused for `cooldown_seconds` (straight to fallback,
+      no timeout wait)
+    - HALF_OPEN: after the cooldown one probe request is let through;
+      success closes the breaker, failure re-opens it
+
+    Thread-safe - shared by every client (and worker thread) sending to
+    the same API URL.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, window_seconds: float, cooldown_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.first_failure_at = 0.0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now (claims the probe when half-open)."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown_seconds:
+                self.state = self.HALF_OPEN
+                return True  # This caller is the probe
+            return False
+
+    def record_success(self) -> None:
+        """The API answered - close the breaker."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failure_count = 0
+
+    def record_failure(self) -> None:
+        """The API was unreachable (timeout, connection error, 5xx)."""
+        with self._lock:
+            now = time.monotonic()
+
+            if self.state == self.HALF_OPEN:
+                # Probe failed - stay open for another cooldown
+                self.state = self.OPEN
+                self.opened_at = now
+                return
+
+            if self.failure_count == 0 or now - self.first_failure_at > self.window_seconds:
+                self.failure_count = 0
+                self.first_failure_at = now
+            self.failure_count += 1
+
+            if self.failure_count >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = now
+                logger.warning(
+                    f"⚡ Circuit opened after {self.failure_count} failures - "
+                    f"skipping sends for {self.cooldown_seconds}s"
+                )
+
+
 # =============================================================================
 # XRAY CLIENT
 # =============================================================================
@@ -36,9 +179,12 @@ class XRayClient:
     HTTP client for sending trace data to the X-Ray API.
 
     Features:
+    - Shared connection pool (keep-alive reused across sends and clients)
     - Automatic retry with exponential backoff
+    - Circuit breaker (fail fast while the API is down)
     - Fallback modes (silent/log/raise)
-    - Async/sync support
+    - Async/sync support (async sends go through a bounded worker queue)
+    - asyncio support (await client.asend(payload))
     - Timeout handling
 
     Example usage:
@@ -54,18 +200,144 @@ class XRayClient:
     Reference: IMPLEMENTATION_PLAN.md -> "Failure Handling"
     """
 
+    # One httpx.Client shared by every XRayClient, so each send reuses a
+    # pooled keep-alive connection instead of a new TCP/TLS handshake.
+    # Created (and httpx imported) on the first real send, so importing
+    # xray or tracing with enabled=False never loads the HTTP stack.
+    _pool: Optional["httpx.Client"] = None
+    _pool_lock = threading.Lock()
+
+    # Connections kept open to the API
+    POOL_MAX_CONNECTIONS = 8
+
+    # httpx.AsyncClient per event loop for asend() - an async client's
+    # connections belong to the loop that opened them
+    _async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+        weakref.WeakKeyDictionary()
+    )
+    ASYNC_POOL_MAX_CONNECTIONS = 32
+
+    # send_async queue and its worker threads, shared by every XRayClient
+    # and started on the first send_async
+    _queue: Optional[queue.Queue] = None
+    _workers: List[threading.Thread] = []
+    _workers_lock = threading.Lock()
+
+    # Traces dropped by send_async because the queue was full. Producers
+    # may be many threads - increment only under _dropped_lock
+    dropped_count = 0
+    _dropped_lock = threading.Lock()
+
+    # One circuit breaker per API URL
+    _breakers: Dict[str, CircuitBreaker] = {}
+    _breakers_lock = threading.Lock()
+
     def __init__(self):
-        """Initialize the HTTP client with current configuration."""
-        self.config = get_config()
+        """
+        Initialize the HTTP client with current configuration.
 
-        # Setup logging if verbose
-        if self.config.verbose:
-            logging.basicConfig(level=logging.DEBUG)
-            logger.setLevel(logging.DEBUG)
-        else:
-            logger.setLevel(logging.WARNING)
+        The client keeps a snapshot: configure() changes the global config in
+        place, and traces this client already queued with send_async must
+        still go to the API (and fallback) they were queued for.
+        """
+        self.config = get_config().model_copy()
+        self._breaker = self._get_breaker(self.config)
+
+        # Setup logging if verbose. setLevel() invalidates every logger's
+        # level cache - only call it when verbose actually changed
+        level = logging.DEBUG if self.config.verbose else logging.WARNING
+        if logger.level != level:
+            if self.config.verbose:
+                logging.basicConfig(level=logging.DEBUG)
+            logger.setLevel(level)
+
+    @classmethod
+    def _get_pool(cls) -> "httpx.Client":
+        """
+        Get the shared connection pool (created on first use).
+
+        httpx.Client is thread-safe, so background sends share it too.
 
-    def send(self, payload: IngestPayload) -> bool:
+        Returns:
+            Shared httpx.Client
+        """
+        if cls._pool is None:
+            with cls._pool_lock:
+                if cls._pool is None:
+                    import httpx
+
+                    cls._pool = httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=cls.POOL_MAX_CONNECTIONS,
+                            max_keepalive_connections=cls.POOL_MAX_CONNECTIONS,
+                        ),
+                    )
+        return cls._pool
+
+    @classmethod
+    def _get_async_pool(cls) -> "httpx.AsyncClient":
+        """
+        Get the running event loop's connection pool (created on first use).
+
+        Returns:
+            httpx.AsyncClient bound to the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        pool = cls._async_pools.get(loop)
+        if pool is None:
+            import httpx
+
+            pool = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=cls.ASYNC_POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=cls.ASYNC_POOL_MAX_CONNECTIONS,
+                ),
+            )
+            cls._async_pools[loop] = pool
+        return pool
+
+    @classmethod
+    async def aclose_pools(cls) -> None:
+        """
+        Close the running event loop's asend() connection pool.
+
+        An AsyncClient can only be closed on the loop that opened it, so
+        _shutdown can't do this at interpreter exit - call it before the
+        loop stops (e.g., in an ASGI lifespan shutdown). Pools of loops
+        that are already closed are dropped too; their connections died
+        with the loop. The next asend() opens a new pool.
+
+        Example:
+            async def main():
+                client = XRayClient()
+                await client.asend(payload)
+                await XRayClient.aclose_pools()
+        """
+        loop = asyncio.get_running_loop()
+        for other_loop in [other for other in cls._async_pools if other.is_closed()]:
+            cls._async_pools.pop(other_loop, None)
+
+        pool = cls._async_pools.pop(loop, None)
+        if pool is not None:
+            await pool.aclose()
+
+    @classmethod
+    def _get_breaker(cls, config: XRayConfig) -> CircuitBreaker:
+        """Get the circuit breaker for config.api_url (created on first use)."""
+        breaker = cls._breakers.get(config.api_url)
+        if breaker is None:
+            with cls._breakers_lock:
+                breaker = cls._breakers.setdefault(
+                    config.api_url,
+                    CircuitBreaker(
+                        failure_threshold=config.breaker_failure_threshold,
+                        window_seconds=config.breaker_window_seconds,
+                        cooldown_seconds=config.breaker_cooldown_seconds,
+                    ),
+                )
+        return breaker
+
+    def send(self, payload: IngestPayload) -> SendResult:
         """
         Send a trace payload to the X-Ray API (synchronous).
 
@@ -73,7 +345,12 @@ class XRayClient:
             payload: The IngestPayload containing run and steps
 
         Returns:
-            True if sent successfully, False otherwise
+            SendResult - truthy if sent successfully (or handled by the
+            LOG fallback, whose file is in .log_path), falsy otherwise
+
+        Retries transient failures up to config.max_retries times before
+        falling back (see XRayConfig retry settings). While the API's
+        circuit breaker is open, falls back immediately without a request.
 
         Example:
             client = XRayClient()
@@ -84,99 +361,539 @@ class XRayClient:
         # Check if tracing is enabled
         if not self.config.enabled:
             logger.debug("X-Ray tracing is disabled, skipping send")
-            return True  # Return True to not disrupt the app
+            return SendResult(True)  # Report success to not disrupt the app
 
         try:
-            # Serialize payload to JSON
-            payload_json = payload.model_dump(mode="json")
+            # Serialize payload straight to JSON bytes in pydantic-core (no
+            # intermediate dict tree) - once, reused by every attempt
+            payload_json = to_json(payload)
+        except Exception as e:
+            logger.warning(f"❌ Unexpected error sending trace: {e}")
+            return self._handle_failure(payload, exception=e)
+
+        logger.debug(
+            f"Sending trace to {self.config.api_url}/api/runs/ingest"
+        )
+        logger.debug(
+            f"Payload: run={payload.run.pipeline_name}, steps={len(payload.steps)}"
+        )
 
+        status_code, error = self._post("/api/runs/ingest", payload_json)
+
+        if status_code in DELIVERED_STATUS_CODES:
             logger.debug(
-                f"Sending trace to {self.config.api_url}/api/runs/ingest"
+                f"✅ Successfully sent trace for run {payload.run.id}"
             )
+            return SendResult(True)
+
+        return self._handle_failure(payload, exception=error, payload_json=payload_json)
+
+    async def asend(self, payload: IngestPayload) -> SendResult:
+        """
+        Send a trace payload to the X-Ray API from async code.
+
+        Same behavior as send() (retries, circuit breaker, fallback modes),
+        but waits on the network with await instead of blocking a thread,
+        so many sends can run concurrently on one event loop.
+
+        The fallback (e.g., the LOG mode's file write) runs in a worker
+        thread so it doesn't block the event loop. Close the loop's
+        connection pool with aclose_pools() before the loop ends.
+
+        Args:
+            payload: The IngestPayload containing run and steps
+
+        Returns:
+            SendResult - truthy if sent successfully (or handled by the
+            LOG fallback), falsy otherwise
+
+        Example:
+            client = XRayClient()
+            results = await asyncio.gather(*(client.asend(p) for p in payloads))
+        """
+        if not self.config.enabled:
+            logger.debug("X-Ray tracing is disabled, skipping send")
+            return SendResult(True)
+
+        try:
+            payload_json = to_json(payload)
+        except Exception as e:
+            logger.warning(f"❌ Unexpected error sending trace: {e}")
+            return await asyncio.to_thread(self._handle_failure, payload, exception=e)
+
+        status_code, error = await self._apost("/api/runs/ingest", payload_json)
+
+        if status_code in DELIVERED_STATUS_CODES:
             logger.debug(
-                f"Payload: run={payload.run.pipeline_name}, steps={len(payload.steps)}"
+                f"✅ Successfully sent trace for run {payload.run.id}"
             )
+            return SendResult(True)
 
-            # Send HTTP POST request
-            response = httpx.post(
-                f"{self.config.api_url}/api/runs/ingest",
-                json=payload_json,
-                timeout=self.config.timeout_seconds,
-                headers={"Content-Type": "application/json"},
-            )
+        return await asyncio.to_thread(
+            self._handle_failure, payload, exception=error, payload_json=payload_json
+        )
 
-            # Check response
-            if response.status_code in (200, 201):
-                logger.debug(
-                    f"✅ Successfully sent trace for run {payload.run.id}"
-                )
-                return True
-            else:
-                logger.warning(
-                    f"❌ API returned status {response.status_code}: {response.text}"
-                )
-                return self._handle_failure(payload, exception=None)
+    def send_batch(self, payloads: List[IngestPayload]) -> bool:
+        """
+        Send several trace payloads in one request (synchronous).
+
+        Uses the API's batch endpoint, so N traces cost one HTTP roundtrip
+        and one database commit instead of N. The API accepts or rejects a
+        batch as a whole: if it answers with an error (4xx, or 5xx after
+        the retries), the traces are re-sent one by one so a single bad
+        trace doesn't lose the rest. If the API can't be reached at all,
+        the fallback mode is applied to every trace.
+
+        Args:
+            payloads: IngestPayloads to send
+
+        Returns:
+            True if every trace was sent (or handled by the fallback)
+
+        Raises:
+            Exception: In RAISE mode, once every trace has been tried, the
+                error of the first trace that failed
+
+        Example:
+            client = XRayClient()
+            client.send_batch([payload_a, payload_b, payload_c])
+        """
+        outcomes = self._send_batch(payloads)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+        return all(outcomes)
+
+    def _send_batch(self, payloads: List[IngestPayload]) -> List[SendOutcome]:
+        """send_batch(), returning each trace's outcome (in order) instead of raising."""
+        if not self.config.enabled:
+            logger.debug("X-Ray tracing is disabled, skipping send")
+            return [SendResult(True)] * len(payloads)
 
-        except httpx.TimeoutException as e:
+        if len(payloads) <= 1:
+            return self._send_each(payloads, self.send)
+
+        try:
+            # list[IngestPayload] -> JSON array, serialized in pydantic-core
+            batch_json = to_json(payloads)
+        except Exception as e:
+            logger.warning(f"❌ Unexpected error sending trace batch: {e}")
+            return self._send_each(payloads, lambda payload: self._handle_failure(payload, exception=e))
+
+        logger.debug(
+            f"Sending batch of {len(payloads)} traces to {self.config.api_url}/api/runs/ingest:batch"
+        )
+
+        status_code, error = self._post("/api/runs/ingest:batch", batch_json)
+
+        # Not DELIVERED_STATUS_CODES: a 409 here means one trace conflicted
+        # and the rest of the batch was rolled back with it
+        if status_code in (200, 201):
+            logger.debug(f"✅ Successfully sent batch of {len(payloads)} traces")
+            return [SendResult(True)] * len(payloads)
+
+        if status_code is not None:
+            # While the API is really down the breaker opens after the first
+            # few individual sends and the rest fall back without a request
+            logger.debug(f"Batch failed with status {status_code}, sending traces individually")
+            return self._send_each(payloads, self.send)
+
+        return self._send_each(payloads, lambda payload: self._handle_failure(payload, exception=error))
+
+    @staticmethod
+    def _send_each(
+        payloads: List[IngestPayload], send_one: Callable[[IngestPayload], SendResult]
+    ) -> List[SendOutcome]:
+        """
+        Apply send_one to every payload, even after one of them raises.
+
+        In RAISE mode a failed trace raises; catching that per trace means
+        the traces after it are still sent, and each keeps its own outcome.
+        """
+        outcomes: List[SendOutcome] = []
+        for payload in payloads:
+            try:
+                outcomes.append(send_one(payload))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _post(self, path: str, body: bytes) -> Tuple[Optional[int], Optional[Exception]]:
+        """
+        POST a JSON body to the API, retrying transient failures.
+
+        Timeouts, connection errors and 5xx responses are retried with
+        exponential backoff; 4xx means the body was rejected (or, for 409,
+        already stored) and is not retried. Stops early while the circuit
+        breaker is open. Outcomes are classified by _check_response and
+        _check_error, shared with _apost.
+
+        Args:
+            path: API path (e.g., /api/runs/ingest)
+            body: Serialized JSON
+
+        Returns:
+            (status code of the last response or None, last exception or None)
+        """
+        pool = self._get_pool()
+
+        status_code: Optional[int] = None
+        last_error: Optional[Exception] = None
+        for attempt in range(self.config.max_retries + 1):
+            if not self._breaker.allow_request():
+                logger.debug(f"Circuit open for {self.config.api_url}, skipping send")
+                break
+
+            if attempt:
+                self._backoff(attempt)
+
+            try:
+                # Send HTTP POST request over a pooled connection
+                response = pool.post(**self._request_args(path, body))
+            except Exception as e:
+                if not self._check_error(e):
+                    return None, e
+                last_error = e
+                continue
+
+            status_code, last_error = response.status_code, None
+            if self._check_response(response):
+                break
+
+        return status_code, last_error
+
+    async def _apost(self, path: str, body: bytes) -> Tuple[Optional[int], Optional[Exception]]:
+        """
+        Async counterpart of _post() - same retry and circuit breaker rules.
+
+        Args:
+            path: API path (e.g., /api/runs/ingest)
+            body: Serialized JSON
+
+        Returns:
+            (status code of the last response or None, last exception or None)
+        """
+        pool = self._get_async_pool()
+
+        status_code: Optional[int] = None
+        last_error: Optional[Exception] = None
+        for attempt in range(self.config.max_retries + 1):
+            if not self._breaker.allow_request():
+                logger.debug(f"Circuit open for {self.config.api_url}, skipping send")
+                break
+
+            if attempt:
+                await asyncio.sleep(self._retry_delay(attempt))
+
+            try:
+                response = await pool.post(**self._request_args(path, body))
+            except Exception as e:
+                if not self._check_error(e):
+                    return None, e
+                last_error = e
+                continue
+
+            status_code, last_error = response.status_code, None
+            if self._check_response(response):
+                break
+
+        return status_code, last_error
+
+    def _request_args(self, path: str, body: bytes) -> Dict[str, Any]:
+        """Keyword arguments for POSTing body to path (sync and async pools take the same)."""
+        return {
+            "url": f"{self.config.api_url}{path}",
+            "content": body,
+            "timeout": self.config.timeout_seconds,
+            "headers": {"Content-Type": "application/json"},
+        }
+
+    def _check_response(self, response: "httpx.Response") -> bool:
+        """
+        Report a response to the circuit breaker.
+
+        Returns:
+            True if the send is finished (delivered or rejected),
+            False if it should be retried (5xx)
+        """
+        status_code = response.status_code
+
+        # Any non-5xx answer means the API is up
+        if status_code < 500:
+            self._breaker.record_success()
+        else:
+            self._breaker.record_failure()
+
+        if status_code in DELIVERED_STATUS_CODES:
+            return True
+
+        logger.warning(
+            f"❌ API returned status {status_code}: {response.text}"
+        )
+        return status_code < 500
+
+    def _check_error(self, error: Exception) -> bool:
+        """
+        Report a request that raised to the circuit breaker.
+
+        Every failure is recorded - a half-open breaker would otherwise keep
+        waiting for this probe and refuse every later send.
+
+        Returns:
+            True if the error is transient (timeout, connection) and the send
+            should be retried, False for anything unexpected
+        """
+        import httpx  # Already loaded by the pool that raised
+
+        self._breaker.record_failure()
+
+        if isinstance(error, httpx.TimeoutException):
             logger.warning(f"⏱️ Request timed out after {self.config.timeout_seconds}s")
-            return self._handle_failure(payload, exception=e)
+            return True
 
-        except httpx.ConnectError as e:
+        if isinstance(error, httpx.TransportError):
             logger.warning(f"🔌 Failed to connect to API at {self.config.api_url}")
-            return self._handle_failure(payload, exception=e)
+            return True
 
-        except Exception as e:
-            logger.warning(f"❌ Unexpected error sending trace: {e}")
-            return self._handle_failure(payload, exception=e)
+        logger.warning(f"❌ Unexpected error sending trace: {error}")
+        return False
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Delay in seconds before retry number `attempt` (1-based).
+
+        Delay = retry_base_delay * 2^(attempt-1), scaled up by a random
+        jitter of up to retry_jitter and capped at retry_max_delay, so
+        clients retrying after an outage don't all hit the API at once.
+        """
+        delay = self.config.retry_base_delay * (2 ** (attempt - 1))
+        delay *= 1 + random.random() * self.config.retry_jitter
+        delay = min(delay, self.config.retry_max_delay)
+
+        logger.debug(f"🔁 Retry {attempt}/{self.config.max_retries} in {delay:.2f}s")
+        return delay
 
-    def send_async(self, payload: IngestPayload) -> None:
+    def _backoff(self, attempt: int) -> None:
+        """Sleep before retry number `attempt` (see _retry_delay)."""
+        time.sleep(self._retry_delay(attempt))
+
+    def send_async(self, payload: IngestPayload) -> "Future[SendResult]":
         """
         Send a trace payload asynchronously (non-blocking).
 
-        This spawns a background thread to send the data so your
-        application doesn't block waiting for the API.
+        The payload is put on a bounded queue drained by a few persistent
+        background threads, so your application doesn't block waiting for
+        the API and no thread is created per send. Traces queued close
+        together are coalesced into one batch request. If the queue is full
+        (API far slower than trace production) the trace is dropped and
+        counted in XRayClient.dropped_count.
 
         Args:
             payload: The IngestPayload containing run and steps
 
+        The trace is sent with this client's configuration (API URL,
+        retries, fallback mode), even if configure() is called before a
+        worker picks it up.
+
+        Returns:
+            Future resolving to this trace's SendResult once it has been
+            processed (falsy if it was dropped). Ignoring it is fine;
+            cancelling it before a worker picks it up skips the trace.
+
         Example:
             client = XRayClient()
             payload = IngestPayload(run=run_model, steps=steps)
             client.send_async(payload)  # Returns immediately
             # Your app continues without waiting
+
+            # Or wait for this trace only (e.g., in a test)
+            client.send_async(payload).result(timeout=2)
         """
-        import threading
+        future: Future = Future()
+        send_queue = self._ensure_workers()
 
-        # Spawn background thread
-        thread = threading.Thread(target=self.send, args=(payload,), daemon=True)
-        thread.start()
+        try:
+            send_queue.put_nowait((self, payload, future))
+        except queue.Full:
+            with XRayClient._dropped_lock:
+                XRayClient.dropped_count += 1
+            logger.warning(
+                f"⚠️ Send queue full ({DEFAULT_CHANNEL_CAP}), dropped trace for run {payload.run.id}"
+            )
+            future.set_result(SendResult(False))
+            return future
 
-        logger.debug(f"🚀 Spawned background thread to send trace")
+        logger.debug(f"🚀 Queued trace for background send")
+        return future
+
+    @classmethod
+    def _ensure_workers(cls) -> queue.Queue:
+        """
+        Create the send queue and start its worker threads (once).
+
+        Returns:
+            The shared send queue
+        """
+        if cls._queue is None:
+            with cls._workers_lock:
+                if cls._queue is None:
+                    send_queue: queue.Queue = queue.Queue(maxsize=DEFAULT_CHANNEL_CAP)
+                    cls._workers = [
+                        threading.Thread(
+                            target=cls._process_jobs,
+                            args=(send_queue,),
+                            name=f"xray-sender-{i}",
+                            daemon=True,
+                        )
+                        for i in range(DEFAULT_WORKER_CNT)
+                    ]
+                    for worker in cls._workers:
+                        worker.start()
+                    cls._queue = send_queue
+        return cls._queue
+
+    @classmethod
+    def _process_jobs(cls, send_queue: queue.Queue) -> None:
+        """
+        Worker loop: block for a trace, then collect whatever else arrives
+        within WORKER_DEFAULT_WAIT_TIME (up to WORKER_BATCH_PROCESSING_SIZE)
+        and send them as one batch request.
+        """
+        while True:
+            batch = [send_queue.get()]
+            deadline = time.monotonic() + WORKER_DEFAULT_WAIT_TIME
+            while len(batch) < WORKER_BATCH_PROCESSING_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(send_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                # Claim each future; traces cancelled while queued are skipped
+                cls._process_tasks([job for job in batch if job[2].set_running_or_notify_cancel()])
+            except Exception as e:
+                # Never let one batch kill the worker - flush() would wait forever
+                logger.error(f"❌ Send worker failed on a batch of {len(batch)} trace(s): {e}")
+            finally:
+                for _ in batch:
+                    send_queue.task_done()
+
+    @classmethod
+    def _process_tasks(cls, batch: List[Tuple["XRayClient", IngestPayload, Future]]) -> None:
+        """
+        Send a batch of queued traces and resolve each trace's future.
+
+        Traces are grouped by the client that queued them, so each one goes
+        out with that client's configuration - one request per group.
+        """
+        groups: Dict[XRayClient, List[Tuple[IngestPayload, Future]]] = {}
+        for client, payload, future in batch:
+            groups.setdefault(client, []).append((payload, future))
+
+        for client, tasks in groups.items():
+            try:
+                outcomes = client._send_batch([payload for payload, _ in tasks])
+            except Exception as e:
+                logger.error(f"❌ Background send failed for {len(tasks)} trace(s): {e}")
+                outcomes = [e] * len(tasks)
+
+            # RAISE fallback mode - each failed trace's error goes to its own future
+            for (_, future), outcome in zip(tasks, outcomes):
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+    @classmethod
+    def flush(cls, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every trace queued by send_async has been processed.
+
+        Called automatically at interpreter exit (see _shutdown).
+
+        Args:
+            timeout: Give up after this many seconds (default: wait forever)
+
+        Returns:
+            True if the queue was drained, False if the timeout expired first
+
+        Example:
+            client.send_async(payload)
+            XRayClient.flush()  # e.g., before a short-lived script exits
+        """
+        send_queue = cls._queue
+        if send_queue is None:
+            return True
+
+        if timeout is None:
+            send_queue.join()
+            return True
+
+        # queue.Queue.join() has no timeout - wait on its condition directly
+        deadline = time.monotonic() + timeout
+        with send_queue.all_tasks_done:
+            while send_queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        f"⚠️ {send_queue.unfinished_tasks} queued trace(s) not sent within {timeout}s"
+                    )
+                    return False
+                send_queue.all_tasks_done.wait(remaining)
+        return True
+
+    @classmethod
+    def _shutdown(cls) -> None:
+        """
+        Interpreter-exit hook: send queued traces, then close the pool.
+
+        Workers are daemon threads, so anything still queued is flushed
+        first (up to SHUTDOWN_FLUSH_TIMEOUT); closing the shared pool
+        afterwards ends its keep-alive connections cleanly. If the flush
+        times out the pool is left open - workers may still be sending
+        through it, and the process exit ends them (and it) anyway.
+        """
+        if not cls.flush(SHUTDOWN_FLUSH_TIMEOUT):
+            logger.warning("⚠️ Send workers still busy at exit, leaving the connection pool open")
+            return
+
+        with cls._pool_lock:
+            if cls._pool is not None:
+                cls._pool.close()
+                cls._pool = None
 
     def _handle_failure(
-        self, payload: IngestPayload, exception: Optional[Exception]
-    ) -> bool:
+        self,
+        payload: IngestPayload,
+        exception: Optional[Exception],
+        payload_json: Optional[bytes] = None,
+    ) -> SendResult:
         """
         Handle failure to send trace according to fallback mode.
 
         Args:
             payload: The failed payload
             exception: The exception that caused the failure (if any)
+            payload_json: The payload already serialized for sending (if any)
 
         Returns:
-            True if failure was handled gracefully, False otherwise
+            SendResult - truthy if the failure was handled gracefully
         """
         mode = self.config.fallback_mode
 
         if mode == FallbackMode.SILENT:
             # Silent mode: just continue
             logger.debug("Fallback mode: SILENT - continuing silently")
-            return False
+            return SendResult(False)
 
         elif mode == FallbackMode.LOG:
             # Log mode: write to file
             logger.info("Fallback mode: LOG - writing trace to file")
-            return self._write_to_log(payload)
+            log_path = self._write_to_log(payload, payload_json)
+            return SendResult(log_path is not None, log_path)
 
         elif mode == FallbackMode.RAISE:
             # Raise mode: raise exception
@@ -188,17 +905,22 @@ class XRayClient:
                     f"Failed to send trace to X-Ray API at {self.config.api_url}"
                 )
 
-        return False
+        return SendResult(False)
 
-    def _write_to_log(self, payload: IngestPayload) -> bool:
+    def _write_to_log(self, payload: IngestPayload, payload_json: Optional[bytes] = None) -> Optional[Path]:
         """
         Write failed trace to local log file.
 
+        The file holds the same JSON body that was sent to the API, so it
+        can be re-posted to /api/runs/ingest as-is.
+
         Args:
             payload: The payload to write
+            payload_json: The payload already serialized by send() - reused
+                instead of serializing again
 
         Returns:
-            True if written successfully
+            Path of the written file, or None if writing failed
         """
         try:
             # Create log directory if it doesn't exist
@@ -210,22 +932,56 @@ class XRayClient:
             filename = f"trace_{timestamp}_{payload.run.id}.json"
             filepath = log_dir / filename
 
-            # Write payload to file
-            with open(filepath, "w") as f:
-                json.dump(payload.model_dump(mode="json"), f, indent=2, default=str)
+            # Write the serialized body straight to the file descriptor -
+            # no Python file object or buffering layer, one write() syscall
+            if payload_json is None:
+                payload_json = to_json(payload)
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(payload_json)
+                while view:
+                    view = view[os.write(fd, view):]
+                if self.config.durable_fallback:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
 
             logger.info(f"📝 Wrote failed trace to {filepath}")
-            return True
+            return filepath
 
         except Exception as e:
             logger.error(f"Failed to write trace to log file: {e}")
-            return False
+            return None
+
+
+atexit.register(XRayClient._shutdown)
 
 
 # =============================================================================
 # HELPER FUNCTION
 # =============================================================================
 
+# Client reused by send_trace, and the configuration version it was built for
+_client: Optional[XRayClient] = None
+_client_config_version = -1
+
+
+def _get_client() -> XRayClient:
+    """
+    Get the shared XRayClient, rebuilding it if the configuration changed.
+
+    Saves creating a client (config lookup, breaker lookup, logging setup)
+    for every trace.
+    """
+    global _client, _client_config_version
+
+    version = get_config_version()
+    client = _client
+    if client is None or _client_config_version != version:
+        client = XRayClient()
+        _client, _client_config_version = client, version
+    return client
+
 
 def send_trace(payload: IngestPayload) -> bool:
     """
@@ -246,13 +1002,12 @@ def send_trace(payload: IngestPayload) -> bool:
         payload = IngestPayload(run=run, steps=steps)
         send_trace(payload)
     """
-    client = XRayClient()
-    config = get_config()
+    client = _get_client()
 
-    if config.async_mode:
+    if client.config.async_mode:
         # Non-blocking send
         client.send_async(payload)
         return True
     else:
         # Blocking send
-        return client.send(payload)
+        return bool(client.send(payload))
@@ -9,7 +9,8 @@ Reference: IMPLEMENTATION_PLAN.md -> "Developer Experience: Progressive Instrume
 
 import os
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Tuple
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -35,6 +36,43 @@ class FallbackMode(str, Enum):
     RAISE = "raise"
 
 
+# Value -> member, so string modes are resolved with one dict lookup
+_FALLBACK_MODES = {mode.value: mode for mode in FallbackMode}
+
+
+def _parse_fallback_mode(value: str) -> FallbackMode:
+    """Resolve a fallback mode string (case-insensitive) to its enum member."""
+    try:
+        return _FALLBACK_MODES[value.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Invalid fallback_mode: {value!r}. Expected one of: {', '.join(_FALLBACK_MODES)}"
+        ) from None
+
+
+# XRayConfig field -> environment variable (see XRayConfig.from_env)
+_ENV_VARS = {
+    "api_url": "XRAY_API_URL",
+    "enabled": "XRAY_ENABLED",
+    "fallback_mode": "XRAY_FALLBACK_MODE",
+    "fallback_log_path": "XRAY_FALLBACK_LOG_PATH",
+    "durable_fallback": "XRAY_DURABLE_FALLBACK",
+    "timeout_seconds": "XRAY_TIMEOUT",
+    "max_retries": "XRAY_MAX_RETRIES",
+    "retry_base_delay": "XRAY_RETRY_BASE_DELAY",
+    "retry_max_delay": "XRAY_RETRY_MAX_DELAY",
+    "retry_jitter": "XRAY_RETRY_JITTER",
+    "breaker_failure_threshold": "XRAY_BREAKER_FAILURE_THRESHOLD",
+    "breaker_window_seconds": "XRAY_BREAKER_WINDOW",
+    "breaker_cooldown_seconds": "XRAY_BREAKER_COOLDOWN",
+    "async_mode": "XRAY_ASYNC_MODE",
+    "max_candidates_full_capture": "XRAY_MAX_CANDIDATES_FULL",
+    "sample_size_large": "XRAY_SAMPLE_SIZE_LARGE",
+    "sample_size_medium": "XRAY_SAMPLE_SIZE_MEDIUM",
+    "verbose": "XRAY_VERBOSE",
+}
+
+
 # =============================================================================
 # XRAY CONFIGURATION
 # =============================================================================
@@ -65,61 +103,112 @@ class XRayConfig(BaseModel):
 
     # Core settings
     api_url: str = Field(
-        default=os.getenv("XRAY_API_URL", "http://localhost:8000"),
+        default="http://localhost:8000",
         description="URL of the X-Ray API server",
     )
 
     enabled: bool = Field(
-        default=os.getenv("XRAY_ENABLED", "true").lower() == "true",
+        default=True,
         description="Enable/disable X-Ray tracing globally",
     )
 
     # Failure handling
     fallback_mode: FallbackMode = Field(
-        default=FallbackMode(os.getenv("XRAY_FALLBACK_MODE", "silent")),
+        default=FallbackMode.SILENT,
         description="What to do when API is unavailable",
     )
 
     fallback_log_path: str = Field(
-        default=os.getenv("XRAY_FALLBACK_LOG_PATH", ".xray/failed_traces/"),
+        default=".xray/failed_traces/",
         description="Where to write traces when using 'log' fallback mode",
     )
 
+    durable_fallback: bool = Field(
+        default=False,
+        description="fsync each 'log' fallback file (survives power loss, costs a disk flush per trace)",
+    )
+
     # Performance settings
     timeout_seconds: float = Field(
-        default=float(os.getenv("XRAY_TIMEOUT", "5.0")),
+        default=5.0,
         description="HTTP request timeout in seconds",
         gt=0,
         le=60,
     )
 
+    # Retry settings (timeouts, connection errors and 5xx responses).
+    # Kept small because a synchronous send() blocks for all attempts:
+    # worst case (max_retries + 1) * timeout_seconds plus ~0.75s of delays
+    max_retries: int = Field(
+        default=2,
+        description="Retries after a failed send before falling back (0 disables)",
+        ge=0,
+    )
+
+    retry_base_delay: float = Field(
+        default=0.25,
+        description="Delay before the first retry in seconds (doubles each retry)",
+        ge=0,
+    )
+
+    retry_max_delay: float = Field(
+        default=30.0,
+        description="Upper bound on a single retry delay in seconds",
+        ge=0,
+    )
+
+    retry_jitter: float = Field(
+        default=0.5,
+        description="Random extra delay, as a fraction of the delay (0.5 = up to +50%)",
+        ge=0,
+    )
+
+    # Circuit breaker (skip sends while the API is down)
+    breaker_failure_threshold: int = Field(
+        default=5,
+        description="Failures within breaker_window_seconds that open the circuit",
+        gt=0,
+    )
+
+    breaker_window_seconds: float = Field(
+        default=30.0,
+        description="Window in seconds for counting consecutive failures",
+        gt=0,
+    )
+
+    breaker_cooldown_seconds: float = Field(
+        default=30.0,
+        description="How long an open circuit skips sends before probing the API again",
+        ge=0,
+    )
+
     async_mode: bool = Field(
-        default=os.getenv("XRAY_ASYNC_MODE", "true").lower() == "true",
+        default=True,
         description="Send traces asynchronously (non-blocking)",
     )
 
     # Sampling settings (for future use with smart sampling)
     max_candidates_full_capture: int = Field(
-        default=int(os.getenv("XRAY_MAX_CANDIDATES_FULL", "100")),
+        default=100,
         description="Capture all candidates if count <= this",
         gt=0,
     )
 
     sample_size_large: int = Field(
-        default=int(os.getenv("XRAY_SAMPLE_SIZE_LARGE", "50")),
+        default=50,
         description="Sample size for large candidate sets (>1000)",
         gt=0,
     )
 
     sample_size_medium: int = Field(
-        default=int(os.getenv("XRAY_SAMPLE_SIZE_MEDIUM", "100")),
+        default=100,
         description="Sample size for medium candidate sets (100-1000)",
         gt=0,
     )
 
     # Debug settings
     verbose: bool = Field(
-        default=os.getenv("XRAY_VERBOSE", "false").lower() == "true",
+        default=False,
         description="Enable verbose logging for debugging",
     )
 
@@ -129,6 +218,29 @@ class XRayConfig(BaseModel):
         """Ensure API URL doesn't have trailing slash"""
         return v.rstrip("/")
 
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = os.environ) -> "XRayConfig":
+        """
+        Build a configuration from XRAY_* variables in a mapping.
+
+        Only `env` is read, at call time: fields whose variable is missing
+        keep their default. Passing a plain dict lets tests configure the
+        SDK without mutating the (process-global) environment.
+
+        Args:
+            env: Variables to read (default: os.environ)
+
+        Returns:
+            XRayConfig with the variables present in `env` applied
+
+        Example:
+            config = XRayConfig.from_env({
+                "XRAY_API_URL": "http://test:8000",
+                "XRAY_FALLBACK_MODE": "raise",
+            })
+        """
+        return cls(**_env_options(env))
+
     model_config = {
         "json_schema_extra": {
             "example": {
@@ -136,6 +248,7 @@ class XRayConfig(BaseModel):
                 "enabled": True,
                 "fallback_mode": "silent",
                 "timeout_seconds": 5.0,
+                "max_retries": 2,
                 "async_mode": True,
                 "verbose": False,
             }
@@ -143,6 +256,21 @@ class XRayConfig(BaseModel):
     }
 
 
+def _env_options(env: Mapping[str, str]) -> dict:
+    """XRayConfig options for the XRAY_* variables present in `env`."""
+    options = {}
+    for field, name in _ENV_VARS.items():
+        if name not in env:
+            continue
+        value = env[name]
+        if field == "fallback_mode":
+            value = _parse_fallback_mode(value)
+        elif XRayConfig.model_fields[field].annotation is bool:
+            value = value.lower() == "true"
+        options[field] = value
+    return options
+
+
 # =============================================================================
 # GLOBAL CONFIGURATION INSTANCE
 # =============================================================================
@@ -150,12 +278,27 @@ class XRayConfig(BaseModel):
 # Singleton configuration instance
 _config: Optional[XRayConfig] = None
 
+# Bumped by configure()/reset_config() so cached objects derived from the
+# configuration (e.g., the shared XRayClient) know when to rebuild
+_config_version = 0
+
+
+@lru_cache(maxsize=32)
+def _build_config(options: Tuple[Tuple[str, Any], ...]) -> XRayConfig:
+    """
+    Validate a configuration once per distinct set of options.
+
+    configure() copies the cached instance, so repeating the same
+    reset_config(); configure(...) (e.g., per test) skips validation.
+    """
+    return XRayConfig(**dict(options))
+
 
 def get_config() -> XRayConfig:
     """
     Get the current X-Ray configuration.
 
-    Creates a default configuration if none exists.
+    Creates a configuration from the environment if none exists.
 
     Returns:
         Current XRayConfig instance
@@ -166,7 +309,7 @@ def get_config() -> XRayConfig:
     """
     global _config
     if _config is None:
-        _config = XRayConfig()
+        _config = XRayConfig.from_env()
     return _config
 
 
@@ -209,15 +352,25 @@ def configure(**kwargs) -> XRayConfig:
         # Disable X-Ray entirely
         configure(enabled=False)
     """
-    global _config
+    global _config, _config_version
+    _config_version += 1
 
     if _config is None:
-        # Create new config with provided settings
-        _config = XRayConfig(**kwargs)
+        # Create new config from the environment (as get_config() would),
+        # with the provided settings on top
+        options = {**_env_options(os.environ), **kwargs}
+        try:
+            _config = _build_config(tuple(sorted(options.items()))).model_copy()
+        except TypeError:
+            # Unhashable option value - can't be cached
+            _config = XRayConfig(**options)
     else:
         # Update existing config
         for key, value in kwargs.items():
             if hasattr(_config, key):
+                # setattr skips validation - store a real enum member, not the raw string
+                if key == "fallback_mode" and isinstance(value, str):
+                    value = _parse_fallback_mode(value)
                 setattr(_config, key, value)
             else:
                 raise ValueError(f"Unknown configuration option: {key}")
@@ -229,6 +382,7 @@ def reset_config() -> None:
     """
     Reset configuration to defaults.
 
+    The next get_config() or configure() reads the environment again.
     Useful for testing.
 
     Example:
@@ -236,8 +390,24 @@ def reset_config() -> None:
         reset_config()
         configure(api_url="http://test:8000")
     """
-    global _config
+    global _config, _config_version
     _config = None
+    _config_version += 1
+
+
+def get_config_version() -> int:
+    """
+    Get a counter that changes whenever configure() or reset_config() runs.
+
+    Returns:
+        Current configuration version
+
+    Example:
+        version = get_config_version()
+        configure(verbose=True)
+        assert get_config_version() != version
+    """
+    return _config_version
 
 
 def is_enabled() -> bool:
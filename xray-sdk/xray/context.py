@@ -12,11 +12,13 @@ Key concepts:
 Reference: IMPLEMENTATION_PLAN.md -> "Context Manager Pattern"
 """
 
-from contextvars import ContextVar
+import time
+from contextvars import ContextVar, Token
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+from .config import is_enabled
 from .models import RunModel, RunStatus, StepModel, StepType
 
 
@@ -86,10 +88,22 @@ class RunContext:
     - Manages run status (running → success/failure)
     - Collects all steps in the run
     - Thread-safe (uses contextvars)
+    - Near-zero cost when tracing is disabled: RunContext(...) then returns
+      a shared no-op context (no models, timing or sending), and
+      get_current_run()/get_current_step() return None
 
     Reference: IMPLEMENTATION_PLAN.md -> "SDK Design Pattern: Context Manager"
     """
 
+    # No per-instance __dict__ - a context is created for every run
+    __slots__ = ("run_model", "steps", "auto_send", "_sequence_counter", "_token")
+
+    def __new__(cls, *args, **kwargs) -> "RunContext":
+        """Return the shared no-op context (skipping __init__) when tracing is disabled."""
+        if not is_enabled():
+            return _DISABLED_RUN_CONTEXT
+        return super().__new__(cls)
+
     def __init__(
         self,
         pipeline_name: str,
@@ -106,7 +120,8 @@ class RunContext:
             metadata: Additional context (user_id, environment, etc.)
             auto_send: If True, automatically send to API when run completes
         """
-        self.run_model = RunModel(
+        # Built by the SDK from typed arguments - skip pydantic validation
+        self.run_model = RunModel.model_construct(
             pipeline_name=pipeline_name,
             pipeline_version=pipeline_version,
             metadata=metadata or {},
@@ -114,7 +129,7 @@ class RunContext:
         self.steps: List[StepModel] = []
         self.auto_send = auto_send
         self._sequence_counter = 0  # Track step order
-        self._previous_run_context: Optional[RunContext] = None
+        self._token: Optional[Token] = None  # Restores the previous run on exit
 
     def __enter__(self) -> "RunContext":
         """
@@ -127,11 +142,9 @@ class RunContext:
 
         Reference: Python Context Manager Protocol
         """
-        # Store the previous run context (in case of nested runs)
-        self._previous_run_context = _current_run_context.get()
-
-        # Set this as the current run
-        _current_run_context.set(self)
+        # Set this as the current run - the token remembers the previous
+        # one (in case of nested runs)
+        self._token = _current_run_context.set(self)
 
         return self
 
@@ -171,14 +184,18 @@ class RunContext:
             from .client import send_trace
             from .models import IngestPayload
 
-            # Create payload with run and all collected steps
-            payload = IngestPayload(run=self.run_model, steps=self.steps)
+            # Create payload with run and all collected steps.
+            # The models were validated when built, so skip re-validating them;
+            # nested steps finish (and are added) before their parent, so
+            # restore sequence order here instead of relying on the validator
+            steps = sorted(self.steps, key=lambda step: step.sequence)
+            payload = IngestPayload.model_construct(run=self.run_model, steps=steps)
 
             # Send to API (respects async_mode and fallback_mode from config)
             send_trace(payload)
 
         # Restore previous run context
-        _current_run_context.set(self._previous_run_context)
+        _current_run_context.reset(self._token)
 
         # Don't suppress exceptions - let them propagate
         return False
@@ -281,6 +298,9 @@ class StepContext:
     Reference: IMPLEMENTATION_PLAN.md -> "SDK Design Pattern: Context Manager"
     """
 
+    # No per-instance __dict__ - a context is created for every step
+    __slots__ = ("run_context", "step_model", "_token", "_start_ns")
+
     def __init__(
         self,
         run_context: RunContext,
@@ -298,12 +318,15 @@ class StepContext:
             sequence: Order in the pipeline (0-indexed)
         """
         self.run_context = run_context
-        self.step_model = StepModel(
+        # Built by the SDK from typed arguments - skip pydantic validation
+        # (StepType() still accepts plain strings like "filter")
+        self.step_model = StepModel.model_construct(
             step_name=step_name,
-            step_type=step_type,
+            step_type=StepType(step_type),
             sequence=sequence,
         )
-        self._previous_step_context: Optional[StepContext] = None
+        self._token: Optional[Token] = None  # Restores the previous step on exit
+        self._start_ns = 0  # perf_counter_ns() at __enter__
 
     def __enter__(self) -> "StepContext":
         """
@@ -311,14 +334,12 @@ class StepContext:
 
         Returns self so user can call methods like set_inputs(), set_reasoning(), etc.
         """
-        # Record start time
+        # Record start time (wall clock for reporting, monotonic for duration)
         self.step_model.start_time = datetime.utcnow()
+        self._start_ns = time.perf_counter_ns()
 
-        # Store previous step context (for nested steps, though rare)
-        self._previous_step_context = _current_step_context.get()
-
-        # Set as current step
-        _current_step_context.set(self)
+        # Set as current step (token remembers the previous one, for nested steps)
+        self._token = _current_step_context.set(self)
 
         return self
 
@@ -329,6 +350,7 @@ class StepContext:
         If an exception occurred, it will be noted in metadata.
         """
         # Record end time
+        self.step_model._duration_ns = time.perf_counter_ns() - self._start_ns
         self.step_model.end_time = datetime.utcnow()
 
         # If an exception occurred, note it
@@ -342,7 +364,7 @@ class StepContext:
         self.run_context.add_step(self.step_model)
 
         # Restore previous step context
-        _current_step_context.set(self._previous_step_context)
+        _current_step_context.reset(self._token)
 
         # Don't suppress exceptions
         return False
@@ -350,6 +372,8 @@ class StepContext:
     # =========================================================================
     # CONVENIENCE METHODS - Make it easy to set data
     # =========================================================================
+    # Values are stored with object.__setattr__: the models don't validate
+    # assignments, so pydantic's __setattr__ dispatch is pure overhead here
 
     def set_inputs(self, inputs: Dict[str, Any]) -> None:
         """
@@ -358,10 +382,14 @@ class StepContext:
         Args:
             inputs: Dictionary of input data
 
+        Note:
+            The dict is stored by reference, not copied - it is serialized
+            when the run is sent. Don't mutate it after this call.
+
         Example:
             step.set_inputs({"product_title": "iPhone 15 Pro", "category": "electronics"})
         """
-        self.step_model.inputs = inputs
+        object.__setattr__(self.step_model, "inputs", inputs)
 
     def set_outputs(self, outputs: Dict[str, Any]) -> None:
         """
@@ -370,10 +398,14 @@ class StepContext:
         Args:
             outputs: Dictionary of output data
 
+        Note:
+            The dict is stored by reference, not copied - it is serialized
+            when the run is sent. Don't mutate it after this call.
+
         Example:
             step.set_outputs({"keywords": ["phone", "case", "protective"]})
         """
-        self.step_model.outputs = outputs
+        object.__setattr__(self.step_model, "outputs", outputs)
 
     def set_reasoning(self, reasoning: str) -> None:
         """
@@ -391,7 +423,7 @@ class StepContext:
                 "Selected these terms because they match the product category."
             )
         """
-        self.step_model.reasoning = reasoning
+        object.__setattr__(self.step_model, "reasoning", reasoning)
 
     def set_candidates(
         self,
@@ -433,7 +465,7 @@ class StepContext:
                 "category": "phone_cases"
             })
         """
-        self.step_model.filters_applied = filters
+        object.__setattr__(self.step_model, "filters_applied", filters)
 
     def add_metadata(self, key: str, value: Any) -> None:
         """
@@ -465,3 +497,58 @@ class StepContext:
             })
         """
         self.step_model.metadata.update(metadata)
+
+
+# =============================================================================
+# DISABLED CONTEXTS - Shared no-op stand-ins used when tracing is off
+# =============================================================================
+
+
+def _ignore(self, *args, **kwargs) -> None:
+    """Accept and discard a setter call."""
+
+
+class _DisabledStepContext:
+    """Same interface as StepContext; records nothing."""
+
+    __slots__ = ()
+
+    @property
+    def step_model(self) -> StepModel:
+        """A throwaway StepModel - code reading or changing it still works, nothing is kept."""
+        return StepModel.model_construct(step_name="disabled", step_type=StepType.CUSTOM)
+
+    def __enter__(self) -> "_DisabledStepContext":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    set_inputs = set_outputs = set_reasoning = set_candidates = _ignore
+    set_filters = add_metadata = update_metadata = _ignore
+
+
+class _DisabledRunContext:
+    """Same interface as RunContext; records and sends nothing."""
+
+    __slots__ = ()
+
+    @property
+    def run_model(self) -> RunModel:
+        """A throwaway RunModel - code reading or changing it still works, nothing is kept."""
+        return RunModel.model_construct(pipeline_name="disabled")
+
+    def __enter__(self) -> "_DisabledRunContext":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def step(self, step_name: str, step_type: StepType = StepType.CUSTOM) -> _DisabledStepContext:
+        return _DISABLED_STEP_CONTEXT
+
+    add_step = set_metadata = set_final_output = _ignore
+
+
+_DISABLED_STEP_CONTEXT = _DisabledStepContext()
+_DISABLED_RUN_CONTEXT = _DisabledRunContext()
@@ -14,9 +14,11 @@ Reference: IMPLEMENTATION_PLAN.md Section "Core Concepts & Design Patterns" -> "
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_validator
+
+from ._uuid import uuid7
 
 
 # =============================================================================
@@ -94,7 +96,7 @@ class StepModel(BaseModel):
     """
 
     # Identity fields
-    id: UUID = Field(default_factory=uuid4, description="Unique identifier for this step")
+    id: UUID = Field(default_factory=uuid7, description="Unique identifier for this step (time-ordered UUIDv7)")
     run_id: Optional[UUID] = Field(default=None, description="Foreign key to parent Run")
 
     # Step identification
@@ -107,8 +109,11 @@ class StepModel(BaseModel):
     end_time: Optional[datetime] = Field(default=None, description="When step ended")
 
     # Decision context - THE CORE OF X-RAY
-    inputs: Dict[str, Any] = Field(default_factory=dict, description="What data went into this step")
-    outputs: Dict[str, Any] = Field(default_factory=dict, description="What data came out of this step")
+    # inputs/outputs/filters_applied are replaced wholesale (set_inputs etc.),
+    # so they default to None instead of allocating an empty dict per step;
+    # the API stores None as {}
+    inputs: Optional[Dict[str, Any]] = Field(default=None, description="What data went into this step")
+    outputs: Optional[Dict[str, Any]] = Field(default=None, description="What data came out of this step")
     reasoning: str = Field(default="", description="WHY this decision was made")
 
     # Candidate tracking (for filtering/selection steps)
@@ -118,10 +123,9 @@ class StepModel(BaseModel):
         default=None,
         description="Full or sampled candidate data (controlled by sampling strategy)"
     )
-
     # Filter details
-    filters_applied: Dict[str, Any] = Field(
-        default_factory=dict,
+    filters_applied: Optional[Dict[str, Any]] = Field(
+        default=None,
         description="Filters used in this step (e.g., {'min_price': 10, 'max_price': 100})"
     )
 
@@ -131,6 +135,9 @@ class StepModel(BaseModel):
         description="Custom metadata (e.g., {'model': 'gpt-4', 'temperature': 0.7})"
     )
 
+    # Monotonic duration measured by StepContext (not serialized)
+    _duration_ns: Optional[int] = PrivateAttr(default=None)
+
     # Pydantic configuration
     model_config = {
         "json_schema_extra": {
@@ -157,21 +164,30 @@ class StepModel(BaseModel):
         Returns None if timing data is incomplete.
         This is useful for performance analysis.
 
+        Steps timed by StepContext use a perf_counter_ns() measurement
+        (immune to wall-clock adjustments); otherwise end_time - start_time.
+
         Example:
             print(f"Step took {step.duration_ms}ms")
         """
+        if self._duration_ns is not None:
+            return self._duration_ns / 1_000_000
         if self.start_time and self.end_time:
             delta = self.end_time - self.start_time
             return delta.total_seconds() * 1000
         return None
 
+    @computed_field
     @property
     def reduction_rate(self) -> Optional[float]:
         """
         Calculate what percentage of candidates were eliminated.
 
         Returns value between 0 and 1 (e.g., 0.95 = 95% eliminated).
-        Returns None if candidate counts are not set.
+        Returns None if candidate counts are not set (or candidates_in is 0).
+
+        Derived from candidates_in/out on every read, so it stays correct
+        however the counts are set; serialized with the step like a field.
 
         This is crucial for debugging aggressive filters!
 
@@ -181,17 +197,16 @@ class StepModel(BaseModel):
 
         Reference: IMPLEMENTATION_PLAN.md -> Queryability -> Cross-pipeline queries
         """
-        if self.candidates_in and self.candidates_out is not None:
-            if self.candidates_in == 0:
-                return None
-            eliminated = self.candidates_in - self.candidates_out
-            return eliminated / self.candidates_in
+        candidates_in = self.candidates_in
+        if candidates_in and self.candidates_out is not None:
+            return (candidates_in - self.candidates_out) / candidates_in
         return None
 
     def set_timing(self, start: datetime, end: datetime) -> None:
         """Helper method to set timing in one call."""
         self.start_time = start
         self.end_time = end
+        self._duration_ns = None  # Explicit times take precedence
 
     def set_candidates(
         self,
@@ -219,8 +234,10 @@ class StepModel(BaseModel):
             # With data, no sampling (testing only)
             step.set_candidates(5000, 50, data=all_candidates, auto_sample=False)
         """
-        self.candidates_in = candidates_in
-        self.candidates_out = candidates_out
+        # Direct writes - assignments aren't validated, so skip pydantic's __setattr__
+        set_field = object.__setattr__
+        set_field(self, "candidates_in", candidates_in)
+        set_field(self, "candidates_out", candidates_out)
 
         # Apply sampling if data provided and auto_sample is True
         if data and auto_sample:
@@ -228,16 +245,16 @@ class StepModel(BaseModel):
 
             if should_sample(data):
                 # Store sampled data + metadata about sampling
-                self.candidates_data = auto_sample_candidates(data)
+                set_field(self, "candidates_data", auto_sample_candidates(data))
                 self.metadata["sampling_applied"] = True
                 self.metadata["original_data_count"] = len(data)
                 self.metadata["sampled_data_count"] = len(self.candidates_data)
             else:
                 # Data is small enough, store as-is
-                self.candidates_data = data
+                set_field(self, "candidates_data", data)
         else:
             # No sampling requested or no data provided
-            self.candidates_data = data
+            set_field(self, "candidates_data", data)
 
 
 # =============================================================================
@@ -263,7 +280,7 @@ class RunModel(BaseModel):
     """
 
     # Identity
-    id: UUID = Field(default_factory=uuid4, description="Unique identifier for this run")
+    id: UUID = Field(default_factory=uuid7, description="Unique identifier for this run (time-ordered UUIDv7)")
 
     # Pipeline identification
     pipeline_name: str = Field(..., description="Name of the pipeline (e.g., 'competitor_selection')")
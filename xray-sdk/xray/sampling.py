@@ -15,12 +15,91 @@ Solution:
 Reference: IMPLEMENTATION_PLAN.md -> "Sampling Strategy"
 """
 
+import math
 import random
-from typing import Any, Dict, List, Optional
+from collections.abc import Sequence
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
 
 from .config import get_config
 
 
+# =============================================================================
+# RESERVOIR SAMPLING (Vitter's Algorithm L)
+# =============================================================================
+#
+# Keeps a uniform random sample of k items from a stream in one pass. Instead
+# of drawing a random number per item, it draws the (geometric) gap to the
+# next item that enters the reservoir, so only O(k * (1 + log(N/k))) random
+# numbers are needed and skipped items are never touched individually.
+
+
+def _open_unit_random() -> float:
+    """Uniform random float in (0, 1) - log() needs it nonzero."""
+    u = random.random()
+    while u == 0.0:
+        u = random.random()
+    return u
+
+
+def _reservoir_weight(sample_size: int) -> float:
+    """Draw an Algorithm L weight factor: exp(log(U) / sample_size)."""
+    return math.exp(math.log(_open_unit_random()) / sample_size)
+
+
+def _reservoir_gap(weight: float) -> int:
+    """How many items to skip before the next one replaces a reservoir slot."""
+    return int(math.log(_open_unit_random()) / math.log1p(-weight))
+
+
+def _reservoir_sample(candidates: Iterable[Any], sample_size: int) -> List[Any]:
+    """
+    Uniformly sample up to sample_size items from any iterable in one pass.
+
+    Sequences (e.g., lists) are indexed directly at each jump; other
+    iterables (e.g., generators) are consumed once and never materialized.
+
+    Args:
+        candidates: Items to sample from
+        sample_size: Reservoir size
+
+    Returns:
+        New list of min(sample_size, N) items (in no particular order)
+    """
+    if sample_size <= 0:
+        return []
+
+    if isinstance(candidates, Sequence):
+        total = len(candidates)
+        reservoir = list(candidates[:sample_size])
+        if total <= sample_size:
+            return reservoir
+
+        weight = _reservoir_weight(sample_size)
+        index = sample_size - 1
+        while True:
+            index += _reservoir_gap(weight) + 1
+            if index >= total:
+                return reservoir
+            reservoir[random.randrange(sample_size)] = candidates[index]
+            weight *= _reservoir_weight(sample_size)
+
+    iterator = iter(candidates)
+    reservoir = list(islice(iterator, sample_size))
+    if len(reservoir) < sample_size:
+        return reservoir
+
+    weight = _reservoir_weight(sample_size)
+    exhausted = object()
+    while True:
+        # Skip the gap in C (islice) and take the item after it
+        candidate = next(islice(iterator, _reservoir_gap(weight), None), exhausted)
+        if candidate is exhausted:
+            return reservoir
+        reservoir[random.randrange(sample_size)] = candidate
+        weight *= _reservoir_weight(sample_size)
+
+
 # =============================================================================
 # SAMPLING STRATEGIES
 # =============================================================================
@@ -129,15 +208,17 @@ def sample_candidates_head_tail(
 
 
 def sample_candidates_random(
-    candidates: List[Dict[str, Any]], sample_size: int = 100
+    candidates: Iterable[Dict[str, Any]], sample_size: int = 100
 ) -> List[Dict[str, Any]]:
     """
     Random sampling across the entire dataset.
 
     Use this when you want a representative sample without bias.
+    Uses reservoir sampling (Algorithm L), so candidates can also be a
+    generator or other one-pass iterable - it is never copied into a list.
 
     Args:
-        candidates: Full list of candidates
+        candidates: Full list (or any iterable) of candidates
         sample_size: How many to sample
 
     Returns:
@@ -146,17 +227,18 @@ def sample_candidates_random(
     Example:
         # Returns 100 random candidates
         sampled = sample_candidates_random(candidates, 100)
-    """
-    total = len(candidates)
 
-    if total <= sample_size:
+        # Works on a stream too
+        sampled = sample_candidates_random(iter_rows(cursor), 100)
+    """
+    if isinstance(candidates, list) and len(candidates) <= sample_size:
         return candidates
 
-    return random.sample(candidates, sample_size)
+    return _reservoir_sample(candidates, sample_size)
 
 
 def sample_candidates_stratified(
-    candidates: List[Dict[str, Any]],
+    candidates: Iterable[Dict[str, Any]],
     strata_key: str,
     samples_per_stratum: int = 10,
 ) -> List[Dict[str, Any]]:
@@ -166,8 +248,12 @@ def sample_candidates_stratified(
     Use this when candidates have categories/groups and you want to see
     examples from each group.
 
+    Single pass: each group keeps its own Algorithm L reservoir, so only
+    samples_per_stratum candidates per group are held (no per-group copy
+    of the input), and candidates can be any one-pass iterable.
+
     Args:
-        candidates: Full list of candidates
+        candidates: Full list (or any iterable) of candidates
         strata_key: Key to group by (e.g., "category", "price_range")
         samples_per_stratum: How many samples per group
 
@@ -185,22 +271,42 @@ def sample_candidates_stratified(
         # Returns 10 samples from each category
         sampled = sample_candidates_stratified(candidates, "category", 10)
     """
-    # Group candidates by strata
-    strata: Dict[Any, List[Dict[str, Any]]] = {}
+    if samples_per_stratum <= 0:
+        return []
+
+    # Per stratum: its reservoir, and once full, [index of the next candidate
+    # to enter it, Algorithm L weight, candidates seen so far]
+    reservoirs: Dict[Any, List[Dict[str, Any]]] = {}
+    jumps: Dict[Any, List[Any]] = {}
+
     for candidate in candidates:
         key = candidate.get(strata_key)
-        if key is not None:
-            if key not in strata:
-                strata[key] = []
-            strata[key].append(candidate)
-
-    # Sample from each stratum
+        if key is None:
+            continue
+
+        reservoir = reservoirs.get(key)
+        if reservoir is None:
+            reservoir = reservoirs[key] = []
+
+        if len(reservoir) < samples_per_stratum:
+            reservoir.append(candidate)
+            if len(reservoir) == samples_per_stratum:
+                weight = _reservoir_weight(samples_per_stratum)
+                jumps[key] = [samples_per_stratum + _reservoir_gap(weight), weight, samples_per_stratum]
+            continue
+
+        jump = jumps[key]
+        index = jump[2]
+        jump[2] = index + 1
+        if index == jump[0]:
+            reservoir[random.randrange(samples_per_stratum)] = candidate
+            jump[1] *= _reservoir_weight(samples_per_stratum)
+            jump[0] = index + _reservoir_gap(jump[1]) + 1
+
+    # Concatenate the per-stratum samples (groups in first-seen order)
     sampled = []
-    for stratum_candidates in strata.values():
-        if len(stratum_candidates) <= samples_per_stratum:
-            sampled.extend(stratum_candidates)
-        else:
-            sampled.extend(random.sample(stratum_candidates, samples_per_stratum))
+    for reservoir in reservoirs.values():
+        sampled.extend(reservoir)
 
     return sampled
 